@@ -35,62 +35,322 @@ export authority as may be required before exporting such information to
 foreign countries or providing access to foreign persons.
 """
 
+import select
 import sys
 import socket
 import struct
 import time
-from typing import Optional, List, Callable
+import threading
+from collections import deque
+from typing import Optional, Callable, List, Tuple
+
+import numpy as np
+
+try:  # Optional accelerator: pip install -e ".[fast]"
+    from numba import njit, types as nb_types
+except ImportError:
+    njit = None
 
 import frame_schema
 import rp_protocol
 
+# Frame layout bound once at import (hot paths avoid module attribute lookups).
+_FRAME_BYTES = frame_schema.FRAME_SIZE_BYTES
+_FRAME_DOUBLES = frame_schema.FRAME_SIZE_DOUBLES
+_FRAME_DTYPE = np.dtype("<f8")
+_FFT_START = frame_schema.FFT_RESULT_CHAN1_START
+_FFT_END = _FFT_START + 2 * frame_schema.FFT_SIZE
+_FFT_LEN = _FFT_END - _FFT_START
+_FFT_START_BYTE = _FFT_START * _FRAME_DTYPE.itemsize
+
+# Init commands sent after connect: reset with argument '01' to register '1',
+# then '00000001' (unsigned ints, little endian), packed once at import.
+_INIT_PAYLOAD = struct.pack("<II", 0x01000001, 0x00000001)
+
+# Per-call non-blocking recv flag (POSIX); 0 where unavailable (Windows).
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
+# Blocking-read slice of the background reader; bounds stop_reader_thread latency.
+_READER_POLL_S = 0.1
+
+# Kernel receive buffer requested for the data socket (bursts of many frames).
+_SO_RCVBUF_BYTES = 4 * 1024 * 1024
+
+# Bit pattern of +inf viewed as a uint64 word. Words below it are finite,
+# non-negative doubles (sign bit clear). NaN and inf words sort at or above it.
+_POS_INF_WORD = np.uint64(0x7FF0000000000000)
+
+
+def _scan_fft_numpy(arr: np.ndarray, start: int, stop: int) -> tuple:
+    """Return (neg_bins, fft_max) over arr[start:stop] using NumPy reductions."""
+    fft = arr[start:stop]
+    if not fft.size:
+        return (0, 0.0)
+    # Prescreen on the raw 64-bit words: if every word is a finite,
+    # non-negative double there are no negative bins and the integer order
+    # matches the float order, so a single integer max yields fft_max.
+    # NaN/inf words fall through to the float path.
+    word_max = fft.view(np.uint64).max()
+    if word_max < _POS_INF_WORD:
+        return (0, float(word_max.view(np.float64)))
+    neg_bins = int(np.count_nonzero(fft < -1e-9))
+    if neg_bins > 10:
+        return (neg_bins, 0.0)  # Already corrupted; skip the max reduction.
+    # fmax skips NaN bins like the scalar scan (NaN never compares greater).
+    return (neg_bins, float(np.fmax.reduce(fft, initial=0.0)))
+
+
+if njit is not None:
+    # Explicit signatures compile eagerly at import (loaded from the on-disk
+    # cache after the first run), so the first frame never pays for the JIT.
+    # Frames from bytes are read-only views; bytearray/ndarray ones are not.
+    _SCAN_FFT_SIGNATURES = [
+        nb_types.Tuple((nb_types.int64, nb_types.float64))(
+            nb_types.Array(nb_types.float64, 1, "C", readonly=readonly),
+            nb_types.int64,
+            nb_types.int64,
+        )
+        for readonly in (False, True)
+    ]
+
+    @njit(_SCAN_FFT_SIGNATURES, cache=True, fastmath=True, boundscheck=False)
+    def _scan_fft(arr, start, stop):
+        """Fused single pass over arr[start:stop] -> (neg_bins, fft_max).
+
+        Stops at the 11th negative bin (the frame is corrupted either way).
+        """
+        neg_bins = 0
+        fft_max = 0.0
+        for k in range(start, min(stop, arr.shape[0])):
+            v = arr[k]
+            if v < -1e-9:
+                neg_bins += 1
+            if v > fft_max:
+                fft_max = v
+            if neg_bins > 10:
+                break
+        return neg_bins, fft_max
+
+else:
+    _scan_fft = _scan_fft_numpy
 
-def check_frame_corruption(output: List[float]) -> tuple:
+
+def check_frame_corruption(output, offset: int = 0) -> tuple:
     """
-    Check if unpacked frame data is corrupted (negative FFT bins or tail-as-FFT).
+    Check if frame data is corrupted (negative FFT bins or tail-as-FFT).
 
     Parameters
     ----------
-    output : list of float
-        Unpacked frame (FRAME_SIZE_DOUBLES doubles).
+    output : bytes-like, np.ndarray or sequence of float
+        Raw little-endian frame bytes (scanned in place, without copying or
+        slicing) or an already unpacked frame of FRAME_SIZE_DOUBLES doubles.
+    offset : int, optional
+        Byte offset of the frame within a bytes-like ``output`` (e.g. the read
+        head of a receive buffer). Default is 0.
 
     Returns
     -------
     tuple of (bool, int, float)
         (corrupted, neg_bins, fft_max).
-        corrupted is True when neg_bins > 10 or fft_max > 1e6.
+        corrupted is True when neg_bins > 10 or fft_max > 1e6. The scan stops
+        early once more than 10 negative bins are found: neg_bins is then only
+        known to exceed 10 and fft_max is not meaningful.
     """
-    neg_bins = 0
-    fft_max = 0.0
-    fft_data_end = (
-        frame_schema.FFT_RESULT_CHAN1_START + 2 * frame_schema.FFT_SIZE
-    )
-    for v in output[frame_schema.FFT_RESULT_CHAN1_START:fft_data_end]:
-        if v < -1e-9:
-            neg_bins += 1
-        if v > fft_max:
-            fft_max = v
+    if isinstance(output, (bytes, bytearray, memoryview)):
+        # View only the FFT region, straight from the buffer.
+        fft = np.frombuffer(output, _FRAME_DTYPE, _FFT_LEN, offset + _FFT_START_BYTE)
+        neg_bins, fft_max = _scan_fft(fft, 0, _FFT_LEN)
+    else:
+        arr = np.ascontiguousarray(output, dtype=np.float64)
+        neg_bins, fft_max = _scan_fft(arr, _FFT_START, _FFT_END)
+    neg_bins = int(neg_bins)
+    fft_max = float(fft_max)
     corrupted = neg_bins > 10 or fft_max > 1e6
     return (corrupted, neg_bins, fft_max)
 
 
+def _tune_socket(sock: socket.socket) -> None:
+    """
+    Set latency/throughput socket options before connecting (best effort).
+
+    TCP_NODELAY sends the small command writes immediately; a larger SO_RCVBUF
+    (set before connect so the window scale is negotiated) lets the kernel
+    absorb frame bursts while the GUI is busy. Unsupported options are ignored.
+    """
+    for level, opt, value in (
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, _SO_RCVBUF_BYTES),
+    ):
+        try:
+            sock.setsockopt(level, opt, value)
+        except OSError:
+            pass
+
+
+def _set_quickack(sock: socket.socket) -> None:
+    """Ask Linux to ACK immediately during the handshake (no-op elsewhere)."""
+    quickack = getattr(socket, "TCP_QUICKACK", None)
+    if quickack is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, quickack, 1)
+    except OSError:
+        pass
+
+
+class _RxBuffer:
+    """Preallocated receive buffer filled in place with socket.recv_into.
+
+    ``buf[rpos:wpos]`` is the pending stream data. Consuming bytes only moves
+    the ``rpos`` head index; the remainder is compacted to the front lazily
+    (once the head passes half the buffer, or when the tail runs out of room).
+    Frames are validated and copied straight out of ``buf``, so each received
+    byte is written once by the kernel and read once by NumPy.
+    """
+
+    def __init__(self, capacity: int = _FRAME_BYTES * 4) -> None:
+        self.buf = bytearray(capacity)
+        self.mv = memoryview(self.buf)
+        self.rpos = 0
+        self.wpos = 0
+
+    def __len__(self) -> int:
+        return self.wpos - self.rpos
+
+    @property
+    def capacity(self) -> int:
+        """Total buffer size in bytes."""
+        return len(self.buf)
+
+    def clear(self) -> None:
+        """Forget any buffered bytes."""
+        self.rpos = 0
+        self.wpos = 0
+
+    def feed(self, data) -> None:
+        """Append already-received bytes (e.g. read past the handshake line)."""
+        n = len(data)
+        if not n:
+            return
+        if n > len(self.buf) - self.wpos:
+            self.compact()
+        n = min(n, len(self.buf) - self.wpos)
+        self.mv[self.wpos:self.wpos + n] = data[:n]
+        self.wpos += n
+
+    def frame_view(self) -> memoryview:
+        """View of the frame at the read head as doubles (not consumed)."""
+        return self.mv[self.rpos:self.rpos + _FRAME_BYTES].cast("d")
+
+    def take_frame(self) -> np.ndarray:
+        """Copy the frame at the read head out of the buffer and consume it."""
+        frame = np.frombuffer(self.buf, _FRAME_DTYPE, _FRAME_DOUBLES, self.rpos).copy()
+        self.consume(_FRAME_BYTES)
+        return frame
+
+    def take_frames(self, max_n: int) -> np.ndarray:
+        """
+        Copy up to max_n buffered frames out as an (n, FRAME_SIZE_DOUBLES) array.
+
+        The frame at the read head must already be validated. Following frames
+        are checked with the same thresholds in one vectorized pass; the batch
+        ends before the first corrupted frame so read_frame can realign it.
+        """
+        n = min(max_n, len(self) // _FRAME_BYTES)
+        block = np.frombuffer(
+            self.buf, _FRAME_DTYPE, n * _FRAME_DOUBLES, self.rpos
+        ).reshape(n, _FRAME_DOUBLES)
+        if n > 1:
+            fft = block[:, _FFT_START:_FFT_END]
+            # Comparisons, not max(): a NaN bin must not hide a >1e6 one.
+            bad = (np.count_nonzero(fft < -1e-9, axis=1) > 10) | (fft > 1e6).any(axis=1)
+            if bad.any():
+                n = max(1, int(bad.argmax()))
+        frames = block[:n].copy()
+        self.consume(n * _FRAME_BYTES)
+        return frames
+
+    def compact(self) -> None:
+        """Move the pending bytes to the front of the buffer."""
+        pending = self.wpos - self.rpos
+        if self.rpos and pending:
+            self.mv[:pending] = self.mv[self.rpos:self.wpos]
+        self.rpos = 0
+        self.wpos = pending
+
+    def recv(
+        self, sock: socket.socket, max_bytes: Optional[int] = None, flags: int = 0
+    ) -> int:
+        """
+        Receive into the free tail of the buffer.
+
+        Parameters
+        ----------
+        sock : socket.socket
+            Socket to read from (honours its current timeout).
+        max_bytes : int, optional
+            Upper bound on bytes to read. Default is all free space.
+        flags : int, optional
+            recv flags (e.g. MSG_DONTWAIT). Default is 0.
+
+        Returns
+        -------
+        int
+            Number of bytes received; 0 means the peer closed the connection.
+        """
+        if self.wpos == len(self.buf):
+            self.compact()
+        space = len(self.buf) - self.wpos
+        if max_bytes is not None:
+            space = min(space, max_bytes)
+        n = sock.recv_into(self.mv[self.wpos:self.wpos + space], space, flags)
+        self.wpos += n
+        return n
+
+    def consume(self, nbytes: int) -> None:
+        """Drop ``nbytes`` from the front by advancing the read head."""
+        self.rpos += nbytes
+        if self.rpos >= self.wpos:
+            self.rpos = 0
+            self.wpos = 0
+        elif self.rpos > len(self.buf) // 2:
+            self.compact()
+
+    def drop_oldest(self, keep_bytes: int) -> None:
+        """Keep only the newest ``keep_bytes`` bytes (desync/backlog guard)."""
+        if self.wpos - self.rpos > keep_bytes:
+            self.rpos = self.wpos - keep_bytes
+
+
 class RPConnection:
     """Owns the socket and RX buffer for RedPitaya TCP connection.
     
     API: connect(ip, port), disconnect(), read_frame(timeout_s=0.0),
-    is_connected, last_read_status, .socket for sending commands.
+    read_frames(max_n), start_reader_thread(), is_connected, last_read_status,
+    .socket for sending commands.
     """
 
     def __init__(self) -> None:
         """Initialize connection state (disconnected, no buffer)."""
         self._socket: Optional[socket.socket] = None
-        self._rxbuf = bytearray()
+        # Last timeout applied to _socket; settimeout is only issued on change.
+        self._current_timeout: Optional[float] = None
+        self._rxbuf = _RxBuffer()
         self._warned_corruption = False
         self.last_read_status: str = "no_socket"
         # Default to the reduced/safer UI until server explicitly advertises laser_lock.
         self._server_variant: str = rp_protocol.RP_CAP_PHASEMETER
         self._capability_line: Optional[str] = None
         self._log_callback: Optional[Callable[[str], None]] = None
+        # Frame handed out by read_frame_view, consumed by release_frame.
+        self._held_view: Optional[memoryview] = None
+        # Optional background reader (start_reader_thread).
+        self._reader: Optional[threading.Thread] = None
+        self._reader_stop = threading.Event()
+        self._reader_status: Optional[str] = None
+        self._ready: deque = deque()
+        self._ready_cv = threading.Condition()
+        self._deferred_warnings: List[str] = []
 
     def set_log_callback(self, cb: Optional[Callable[[str], None]]) -> None:
         """Set optional callback for warnings (e.g. GUI log). Called with message str."""
@@ -168,47 +428,55 @@ class RPConnection:
         OSError
             On connection failure or timeout.
         """
+        self.stop_reader_thread()
         address = (ip, port)
         client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        _tune_socket(client_socket)
         client_socket.settimeout(timeout_s)
         client_socket.connect(address)
+        _set_quickack(client_socket)
 
         # Read capability handshake: "RP_CAP:laser_lock\n" or "RP_CAP:phasemeter\n"
         # Default to phasemeter until an explicit capability line advertises laser_lock.
         self._server_variant = rp_protocol.RP_CAP_PHASEMETER
         self._capability_line = None
+        # Bytes received past the line (or all of them, for servers without a
+        # handshake) are frame data and are kept for the first read_frame.
         client_socket.settimeout(1.0)
+        buf = bytearray()
+        leftover = b""
         try:
-            buf = bytearray()
-            while len(buf) < rp_protocol.RP_CAP_LINE_MAX:
-                chunk = client_socket.recv(1)
+            nl = -1
+            while nl < 0 and len(buf) < rp_protocol.RP_CAP_LINE_MAX:
+                chunk = client_socket.recv(rp_protocol.RP_CAP_LINE_MAX - len(buf))
                 if not chunk:
                     break
-                if chunk == b"\n":
-                    line = buf.decode("ascii", errors="replace").strip()
-                    self._capability_line = line
-                    if line.startswith(rp_protocol.RP_CAP_PREFIX):
-                        variant = line[len(rp_protocol.RP_CAP_PREFIX) :].strip()
-                        if variant == rp_protocol.RP_CAP_PHASEMETER:
-                            self._server_variant = rp_protocol.RP_CAP_PHASEMETER
-                        elif variant == rp_protocol.RP_CAP_LASER_LOCK:
-                            self._server_variant = rp_protocol.RP_CAP_LASER_LOCK
-                    break
-                buf.extend(chunk)
+                buf += chunk
+                nl = buf.find(b"\n")
+            leftover = buf
+            if nl >= 0:
+                line = buf[:nl].decode("ascii", errors="replace").strip()
+                self._capability_line = line
+                if line.startswith(rp_protocol.RP_CAP_PREFIX):
+                    leftover = buf[nl + 1 :]
+                    variant = line[len(rp_protocol.RP_CAP_PREFIX) :].strip()
+                    if variant == rp_protocol.RP_CAP_PHASEMETER:
+                        self._server_variant = rp_protocol.RP_CAP_PHASEMETER
+                    elif variant == rp_protocol.RP_CAP_LASER_LOCK:
+                        self._server_variant = rp_protocol.RP_CAP_LASER_LOCK
         except (OSError, UnicodeDecodeError, socket.timeout):
-            pass
+            leftover = buf
 
-        cmd1 = struct.pack("<I", int("01000001", 16))
-        cmd2 = struct.pack("<I", int("00000001", 16))
-        client_socket.send(cmd1)
-        time.sleep(0.05)
-
-        client_socket.send(cmd2)
-        time.sleep(0.05)
+        # Both init words go out in one write: the server parses the command
+        # stream word by word (register writes are already sent back to back).
+        client_socket.sendall(_INIT_PAYLOAD)
 
         client_socket.settimeout(None)
         self._socket = client_socket
-        self._rxbuf = bytearray()
+        self._current_timeout = None
+        self._held_view = None
+        self._rxbuf.clear()
+        self._rxbuf.feed(leftover)
         self._warned_corruption = False
         self.last_read_status = "no_data"
 
@@ -222,9 +490,12 @@ class RPConnection:
         -------
         None
         """
+        self.stop_reader_thread()
         s = self._socket
         self._socket = None
-        self._rxbuf = bytearray()
+        self._current_timeout = None
+        self._held_view = None
+        self._rxbuf.clear()
         self._warned_corruption = False
         self._server_variant = rp_protocol.RP_CAP_PHASEMETER
         self._capability_line = None
@@ -238,7 +509,7 @@ class RPConnection:
 
     def read_frame(
         self, timeout_s: float = 0.0, suppress_corruption_warning: bool = False
-    ) -> Optional[List[float]]:
+    ) -> Optional[np.ndarray]:
         """
         Read one full frame from the socket.
 
@@ -253,107 +524,305 @@ class RPConnection:
 
         Returns
         -------
-        list of float or None
-            One frame of FRAME_SIZE_DOUBLES doubles, or None if no frame available
-            or on error. Updates last_read_status ("ok", "no_data", "timeout",
-            "closed", "parse_error", "os_error", "no_socket").
+        np.ndarray or None
+            One frame of FRAME_SIZE_DOUBLES float64 values (an owned copy), or
+            None if no frame available or on error. Updates last_read_status
+            ("ok", "no_data", "timeout", "closed", "parse_error", "os_error",
+            "no_socket").
+        """
+        self.release_frame()
+        if self._reader is not None:
+            return self._pop_ready(timeout_s, None)
+        frame, self.last_read_status = self._read(
+            timeout_s, suppress_corruption_warning, None
+        )
+        return frame
+
+    def read_frames(
+        self,
+        max_n: int = 16,
+        timeout_s: float = 0.0,
+        suppress_corruption_warning: bool = False,
+    ) -> Optional[np.ndarray]:
+        """
+        Read all complete, valid frames already buffered (up to max_n) at once.
+
+        Same socket handling and realignment as read_frame for the first frame;
+        the following buffered frames are validated in one vectorized pass and
+        the batch stops before the first corrupted one (realigned next call).
+
+        Parameters
+        ----------
+        max_n : int, optional
+            Maximum number of frames to return. Default is 16.
+        timeout_s : float, optional
+            If > 0, wait up to this many seconds for the first frame. Default is 0.0.
+        suppress_corruption_warning : bool, optional
+            If True, do not log the desync warning when realigning. Default is False.
+
+        Returns
+        -------
+        np.ndarray or None
+            Array of shape (n, FRAME_SIZE_DOUBLES) with 1 <= n <= max_n, oldest
+            frame first, or None (see last_read_status).
+        """
+        max_n = max(1, int(max_n))
+        self.release_frame()
+        if self._reader is not None:
+            return self._pop_ready(timeout_s, max_n)
+        frames, self.last_read_status = self._read(
+            timeout_s, suppress_corruption_warning, max_n
+        )
+        return frames
+
+    def read_frame_view(
+        self, timeout_s: float = 0.0, suppress_corruption_warning: bool = False
+    ) -> Optional[memoryview]:
+        """
+        Read one frame as a zero-copy view into the receive buffer.
+
+        The frame is validated like read_frame but not copied or consumed: the
+        returned memoryview (format 'd', FRAME_SIZE_DOUBLES items) points into
+        the RX buffer and stays valid until release_frame() or the next read
+        call, which consumes it. Copy anything that must outlive that.
+
+        Parameters
+        ----------
+        timeout_s : float, optional
+            If > 0, wait up to this many seconds for a full frame. Default is 0.0.
+        suppress_corruption_warning : bool, optional
+            If True, do not log the desync warning when realigning. Default is False.
+
+        Returns
+        -------
+        memoryview or None
+            View of the frame, or None (see last_read_status).
+        """
+        self.release_frame()
+        if self._reader is not None:
+            # Frames are already owned arrays when the reader thread runs.
+            frame = self._pop_ready(timeout_s, None)
+            return None if frame is None else memoryview(frame)
+        view, self.last_read_status = self._read(
+            timeout_s, suppress_corruption_warning, 0
+        )
+        self._held_view = view
+        return view
+
+    def release_frame(self) -> None:
+        """Consume the frame returned by read_frame_view (no-op if none held)."""
+        view = self._held_view
+        if view is None:
+            return
+        self._held_view = None
+        try:
+            view.release()
+        except BufferError:
+            pass  # Still exported by the caller (e.g. np.frombuffer); drop our ref.
+        self._rxbuf.consume(_FRAME_BYTES)
+
+    def start_reader_thread(self, max_pending: int = 8) -> None:
+        """
+        Receive and validate frames on a background daemon thread.
+
+        While it runs, read_frame/read_frames only pop already-parsed frames
+        from a bounded queue (the oldest are dropped when the consumer falls
+        behind), so socket I/O and frame checks overlap with the caller's work.
+        Corruption warnings are delivered on the consumer's thread. Stopped by
+        stop_reader_thread() or disconnect().
+
+        Parameters
+        ----------
+        max_pending : int, optional
+            Maximum number of frames kept for the consumer. Default is 8.
+
+        Raises
+        ------
+        RuntimeError
+            If not connected.
         """
         if self._socket is None:
-            self.last_read_status = "no_socket"
+            raise RuntimeError("start_reader_thread requires an open connection")
+        if self._reader is not None:
+            return
+        self._ready = deque(maxlen=max(1, int(max_pending)))
+        self._reader_status = None
+        self._reader_stop.clear()
+        self._reader = threading.Thread(
+            target=self._reader_loop, name="rp-frame-reader", daemon=True
+        )
+        self._reader.start()
+
+    def stop_reader_thread(self, timeout_s: float = 1.0) -> None:
+        """Stop the background reader (if any) and return to direct reads."""
+        reader = self._reader
+        if reader is None:
+            return
+        self._reader_stop.set()
+        if reader is not threading.current_thread():
+            reader.join(timeout_s)
+        self._reader = None
+        self._ready.clear()
+
+    def _reader_loop(self) -> None:
+        """Background thread body: blocking reads pushed into the ready queue."""
+        status = "no_data"
+        while not self._reader_stop.is_set():
+            frame, status = self._read(_READER_POLL_S, False, None)
+            if frame is not None:
+                with self._ready_cv:
+                    self._ready.append(frame)
+                    self._ready_cv.notify()
+            elif status in ("closed", "os_error", "no_socket"):
+                break
+        with self._ready_cv:
+            self._reader_status = status if not self._reader_stop.is_set() else None
+            self._ready_cv.notify_all()
+
+    def _pop_ready(self, timeout_s: float, max_n: Optional[int]) -> Optional[np.ndarray]:
+        """Consumer side of the reader thread: pop one frame or a batch."""
+        self._flush_deferred_warnings()
+        with self._ready_cv:
+            if not self._ready and timeout_s and timeout_s > 0:
+                self._ready_cv.wait_for(
+                    lambda: self._ready or self._reader_status is not None, timeout_s
+                )
+            if self._ready:
+                self.last_read_status = "ok"
+                if max_n is None:
+                    return self._ready.popleft()
+                n = min(max_n, len(self._ready))
+                return np.stack([self._ready.popleft() for _ in range(n)])
+            if self._reader_status is not None:
+                self.last_read_status = self._reader_status
+            else:
+                self.last_read_status = "timeout" if timeout_s and timeout_s > 0 else "no_data"
             return None
 
-        prev_timeout = self._socket.gettimeout()
-        self.last_read_status = "no_data"
+    def _flush_deferred_warnings(self) -> None:
+        """Emit warnings raised on the reader thread from the caller's thread."""
+        while self._deferred_warnings:
+            self._emit_warning(self._deferred_warnings.pop(0))
+
+    def _set_timeout(self, timeout_s: Optional[float]) -> None:
+        """Apply a socket timeout, skipping the syscall when it is unchanged."""
+        if timeout_s != self._current_timeout:
+            self._socket.settimeout(timeout_s)
+            self._current_timeout = timeout_s
+
+    def _warn_once(self, msg: str) -> None:
+        """Report a stream desync once per connection (stderr and log callback)."""
+        if self._warned_corruption:
+            return
+        self._warned_corruption = True
+        if self._reader is not None and threading.current_thread() is self._reader:
+            # The log callback may touch GUI objects; hand it to the consumer.
+            self._deferred_warnings.append(msg)
+            return
+        self._emit_warning(msg)
 
-        def warn_once(msg: str) -> None:
-            if self._warned_corruption:
-                return
-            self._warned_corruption = True
+    def _emit_warning(self, msg: str) -> None:
+        """Print a warning and forward it to the log callback, if any."""
+        try:
+            print(msg, file=sys.stderr)
+        except Exception:
+            pass
+        if self._log_callback:
             try:
-                print(msg, file=sys.stderr)
+                self._log_callback(msg)
             except Exception:
                 pass
-            if self._log_callback:
-                try:
-                    self._log_callback(msg)
-                except Exception:
-                    pass
 
-        try:
-            self._socket.settimeout(timeout_s if timeout_s and timeout_s > 0 else 0.0)
+    def _read(
+        self, timeout_s: float, suppress_corruption_warning: bool, max_n: Optional[int]
+    ) -> Tuple[Optional[np.ndarray], str]:
+        """
+        Fill, realign and take one frame (max_n None), a batch, or a view (max_n 0).
+
+        Returns (frames or None, read status); does not touch last_read_status
+        so it can run on the background reader thread.
+        """
+        if self._socket is None:
+            return None, "no_socket"
 
+        try:
+            # Waiting is done with select(); every recv is non-blocking. The socket
+            # stays in blocking mode (for command writes) and reads pass
+            # MSG_DONTWAIT where available, so steady polling changes no socket
+            # state. Without the flag (Windows) the socket is set non-blocking once.
+            self._set_timeout(None if _MSG_DONTWAIT else 0.0)
+            flags = _MSG_DONTWAIT
+
+            rx = self._rxbuf
             # Frame alignment: on corruption (misaligned stream), discard 1 byte and retry.
             align_discard = 0
-            max_align_discard = frame_schema.FRAME_SIZE_BYTES
+            max_align_discard = _FRAME_BYTES
 
             while align_discard <= max_align_discard:
                 if timeout_s and timeout_s > 0:
-                    while len(self._rxbuf) < frame_schema.FRAME_SIZE_BYTES:
+                    deadline = time.monotonic() + timeout_s
+                    while len(rx) < _FRAME_BYTES:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return None, "timeout"
+                        readable, _, _ = select.select([self._socket], [], [], remaining)
+                        if not readable:
+                            return None, "timeout"
+                        # Pull whatever has arrived (up to the free space).
                         try:
-                            chunk = self._socket.recv(
-                                frame_schema.FRAME_SIZE_BYTES - len(self._rxbuf)
-                            )
-                        except socket.timeout:
-                            self.last_read_status = "timeout"
-                            return None
-                        if not chunk:
-                            self.last_read_status = "closed"
-                            return None
-                        self._rxbuf += chunk
+                            n = rx.recv(self._socket, None, flags)
+                        except (BlockingIOError, InterruptedError):
+                            continue
+                        if not n:
+                            return None, "closed"
                 else:
                     while True:
+                        # Buffer full: keep only the newest frames (avoid backlog growth).
+                        if len(rx) == rx.capacity:
+                            rx.drop_oldest(_FRAME_BYTES * 2)
                         try:
-                            chunk = self._socket.recv(64 * 1024)
+                            n = rx.recv(self._socket, None, flags)
                         except (BlockingIOError, InterruptedError):
                             break
-                        except socket.timeout:
-                            break
-                        if not chunk:
-                            self.last_read_status = "closed"
-                            return None
-                        self._rxbuf += chunk
-                        if len(self._rxbuf) > frame_schema.FRAME_SIZE_BYTES * 4:
-                            del self._rxbuf[:-frame_schema.FRAME_SIZE_BYTES * 2]
-
-                if len(self._rxbuf) < frame_schema.FRAME_SIZE_BYTES:
-                    self.last_read_status = "no_data"
-                    return None
+                        if not n:
+                            return None, "closed"
 
-                raw = bytes(self._rxbuf[:frame_schema.FRAME_SIZE_BYTES])
-                output = struct.unpack(f"{frame_schema.FRAME_SIZE_DOUBLES}d", raw)
+                if len(rx) < _FRAME_BYTES:
+                    return None, "no_data"
 
-                corrupted, neg_bins, fft_max = check_frame_corruption(output)
+                # Validate straight from the RX buffer; only copy out a good frame.
+                corrupted, neg_bins, fft_max = check_frame_corruption(rx.buf, rx.rpos)
                 if corrupted:
                     if align_discard == 0 and not suppress_corruption_warning:
-                        warn_once(
+                        self._warn_once(
                             "Warning: frame desynchronized (neg_bins=%d, fft_max=%.2e); "
                             "realigning..."
                             % (neg_bins, fft_max)
                         )
-                    del self._rxbuf[:1]
+                    rx.consume(1)
                     align_discard += 1
                     continue
 
-                del self._rxbuf[:frame_schema.FRAME_SIZE_BYTES]
-                self.last_read_status = "ok"
-                return list(output)
+                if max_n is None:
+                    output = rx.take_frame()
+                elif max_n == 0:
+                    output = rx.frame_view()
+                else:
+                    output = rx.take_frames(max_n)
+                return output, "ok"
 
-            self.last_read_status = "parse_error"
-            return None
-        except struct.error:
-            self.last_read_status = "parse_error"
-            return None
+            return None, "parse_error"
         except OSError:
-            self.last_read_status = "os_error"
-            return None
-        finally:
-            try:
-                self._socket.settimeout(prev_timeout)
-            except Exception:
-                pass
+            return None, "os_error"
 
 
 # Legacy API: module-level state for readRPdata/clear_rxbuf when using raw socket.
+# RX buffers are keyed by id(socket) (no fileno() syscall per read). Ids can be
+# reused once a socket is garbage collected, so call clear_rxbuf() on close.
+_LEGACY_RXBUFS: dict = {}
+_legacy_warned_corruption = False
+
+
 def connect2RP(ip, port, timeout_s=0.5):
     """
     Connect to the RedPitaya and return a raw socket (legacy API).
@@ -381,26 +850,14 @@ def connect2RP(ip, port, timeout_s=0.5):
     """
     address = (ip,port) # TCP address = IP + port
     client_socket = socket.socket(socket.AF_INET,socket.SOCK_STREAM) # Creation of the client socket.
+    _tune_socket(client_socket)
     client_socket.settimeout(timeout_s)
     client_socket.connect(address) # Connection of the client_socket using the address information
 
     # Sending the right commands to the RP so it starts sending data
-    # These commands are interpreted by the RP and used for initial configuration.
-    
-    # The first one is a reset with argument '01' to register '1'
-    # Sending the command to the RP via the socket. The weird two-lines step below is needed to compensate for the enconding of the hex data in the RP
-    command=int("01000001",16)
-    commandInv=struct.pack("<I",command) # unsigned Int to object ('hex string') using little Endian
-    client_socket.send(commandInv)
-    time.sleep(0.05) # The short sleep is necessary between commands to avoid mixing information on the receiving end.
-
-
-
-    # Sending the command to the RP via the socket. The weird two-lines step below is needed to compensate for the enconding of the hex data in the RP
-    command=int("00000001",16)
-    commandInv=struct.pack("<I",command) # unsigned Int to object ('hex string') using little Endian
-    client_socket.send(commandInv)
-    time.sleep(0.05) # The short sleep is necessary between commands to avoid mixing information on the receiving end.
+    # (see _INIT_PAYLOAD), in a single write: the server parses the command
+    # stream word by word, so no pause is needed in between.
+    client_socket.sendall(_INIT_PAYLOAD)
 
     # It returns the client_socket so that it can be used aftewards to modify the settings of the different registers
     # Switch back to blocking mode; reads can still use per-call timeouts.
@@ -429,33 +886,28 @@ def readRPdata(client_socket, timeout_s=0.0):
 
     Returns
     -------
-    list of float or None
-        One frame of doubles, or None. Check readRPdata.last_status for reason.
+    np.ndarray or None
+        One frame of float64 values, or None. Check readRPdata.last_status for reason.
     """
-    output=[]
     if client_socket is None:
         readRPdata.last_status = "no_socket"
         return None
 
     # Keep per-socket receive buffers so partial frames aren't lost between calls.
-    # Key by fileno to avoid keeping sockets alive unintentionally.
-    if not hasattr(readRPdata, "_rxbuf_by_fileno"):
-        readRPdata._rxbuf_by_fileno = {}
-    if not hasattr(readRPdata, "_warned_corruption"):
-        readRPdata._warned_corruption = False
-
+    # Key by id() to avoid keeping sockets alive unintentionally.
     prev_timeout = client_socket.gettimeout()
-    fileno = client_socket.fileno()
     readRPdata.last_status = "no_data"
-    rxbuf = readRPdata._rxbuf_by_fileno.get(fileno)
+    key = id(client_socket)
+    rxbuf = _LEGACY_RXBUFS.get(key)
     if rxbuf is None:
-        rxbuf = bytearray()
-        readRPdata._rxbuf_by_fileno[fileno] = rxbuf
+        rxbuf = _RxBuffer()
+        _LEGACY_RXBUFS[key] = rxbuf
 
     def warn_once(msg: str) -> None:
-        if readRPdata._warned_corruption:
+        global _legacy_warned_corruption
+        if _legacy_warned_corruption:
             return
-        readRPdata._warned_corruption = True
+        _legacy_warned_corruption = True
         try:
             print(msg, file=sys.stderr)
         except Exception:
@@ -469,63 +921,50 @@ def readRPdata(client_socket, timeout_s=0.0):
 
         if timeout_s and timeout_s > 0:
             # Bounded wait until we have at least one full frame.
-            while len(rxbuf) < frame_schema.FRAME_SIZE_BYTES:
+            while len(rxbuf) < _FRAME_BYTES:
                 try:
-                    chunk = client_socket.recv(frame_schema.FRAME_SIZE_BYTES - len(rxbuf))
+                    n = rxbuf.recv(client_socket, _FRAME_BYTES - len(rxbuf))
                 except socket.timeout:
                     readRPdata.last_status = "timeout"
                     return None
-                if not chunk:
+                if not n:
                     readRPdata.last_status = "closed"
                     return None
-                rxbuf += chunk
         else:
             # Non-blocking: drain available bytes quickly.
             while True:
+                # Avoid unbounded growth if we were desynced; keep only the newest few frames.
+                if len(rxbuf) == rxbuf.capacity:
+                    rxbuf.drop_oldest(_FRAME_BYTES * 2)
                 try:
-                    chunk = client_socket.recv(64 * 1024)
+                    n = rxbuf.recv(client_socket)
                 except (BlockingIOError, InterruptedError):
                     readRPdata.last_status = "no_data"
                     break
                 except socket.timeout:
                     readRPdata.last_status = "no_data"
                     break
-                if not chunk:
+                if not n:
                     readRPdata.last_status = "closed"
                     return None
-                rxbuf += chunk
-                # Avoid unbounded growth if we were desynced; keep only the newest few frames.
-                if len(rxbuf) > frame_schema.FRAME_SIZE_BYTES * 4:
-                    del rxbuf[:-frame_schema.FRAME_SIZE_BYTES * 2]
 
-        if len(rxbuf) < frame_schema.FRAME_SIZE_BYTES:
+        if len(rxbuf) < _FRAME_BYTES:
             readRPdata.last_status = "no_data"
             return None
 
-        raw = bytes(rxbuf[:frame_schema.FRAME_SIZE_BYTES])
-        del rxbuf[:frame_schema.FRAME_SIZE_BYTES]
-
-        output = struct.unpack(f"{frame_schema.FRAME_SIZE_DOUBLES}d", raw)
+        output = rxbuf.take_frame()
 
         # Minimal sanity check: FFT magnitudes are expected to be >= 0.
         # Allow tiny numerical noise, but not large negative values across many bins.
-        neg_bins = 0
-        fft_data_end = frame_schema.FFT_RESULT_CHAN1_START + 2 * frame_schema.FFT_SIZE
-        for v in output[frame_schema.FFT_RESULT_CHAN1_START:fft_data_end]:
-            if v < -1e-9:
-                neg_bins += 1
-                if neg_bins > 10:
-                    warn_once(
-                        "Warning: received a frame with many negative FFT magnitudes; "
-                        "stream may be corrupted or desynchronized."
-                    )
-                    break
+        _, neg_bins, _ = check_frame_corruption(output)
+        if neg_bins > 10:
+            warn_once(
+                "Warning: received a frame with many negative FFT magnitudes; "
+                "stream may be corrupted or desynchronized."
+            )
 
         readRPdata.last_status = "ok"
-        return list(output)
-    except struct.error:
-        readRPdata.last_status = "parse_error"
-        return None
+        return output
     except OSError:
         readRPdata.last_status = "os_error"
         return None
@@ -546,16 +985,9 @@ def clear_rxbuf(client_socket) -> None:
     Parameters
     ----------
     client_socket : socket.socket
-        Socket whose buffer should be cleared (identified by fileno).
+        Socket whose buffer should be cleared (identified by id()).
     """
-    try:
-        fileno = client_socket.fileno()
-    except Exception:
-        return
-    rxbufs = getattr(readRPdata, "_rxbuf_by_fileno", None)
-    if not isinstance(rxbufs, dict):
-        return
-    rxbufs.pop(fileno, None)
+    _LEGACY_RXBUFS.pop(id(client_socket), None)
 
 
 
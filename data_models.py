@@ -37,50 +37,76 @@ foreign countries or providing access to foreign persons.
 
 import numpy as np
 from dataclasses import dataclass
-from typing import Optional, List, Union
+from enum import IntEnum
+from typing import Dict, Optional, List, Tuple, Union
 import global_params as glp
+
+try:  # Optional accelerator: pip install -e ".[fast]"
+	from numba import njit, types as nb_types
+except ImportError:
+	njit = None
+
 import frame_schema
 
 
-def update_data_t(array, data):
-	"""
-	Append one sample to the end of a 1D array and drop the first element.
+_DEBUG = False  # enable internal contract checks on hot paths
 
-	Parameters
-	----------
-	array : numpy.ndarray
-		One-dimensional array (modified in place via reassignment).
-	data : scalar or array-like
-		Value(s) to append.
+# Tail fields are 7 contiguous (ch0, ch1) pairs in Frame order: pir, q, i, piezo,
+# temp, freqerr, beatfreq (PLL0PIR .. MAX_ABS_FREQ1)
+_TAIL_STOP = frame_schema.MAX_ABS_FREQ1 + 1
 
-	Returns
-	-------
-	numpy.ndarray
-		New array of same length: [array[1:], data].
-	"""
-	array = np.append(array, data)
-	array = np.delete(array, 0)
-	return array
 
-def update_data_t2(array, data):
-	"""
-	Update two 1D time-series arrays with new samples (rolling window).
+# Whole-frame record layout (must match `server/esw/memory_map.h::FRAME_CONTENT_ADDRESS_OFFSET`)
+FRAME_DTYPE = np.dtype([
+	("cnt", "<f8"),
+	("spectrum", "<f8", (2, frame_schema.FFT_SIZE)),
+	("_pad", "<f8"),  # index 2*FFT_SIZE + 1, unused
+	("pir", "<f8", (2,)),
+	("q", "<f8", (2,)),
+	("i", "<f8", (2,)),
+	("piezo", "<f8", (2,)),
+	("temp", "<f8", (2,)),
+	("freqerr", "<f8", (2,)),
+	("beatfreq", "<f8", (2,)),
+])
+assert FRAME_DTYPE.itemsize == frame_schema.FRAME_SIZE_BYTES
+assert FRAME_DTYPE.fields["pir"][1] == frame_schema.PLL0PIR * 8
 
-	Parameters
-	----------
-	array : list of two numpy.ndarray
-		[channel0_series, channel1_series].
-	data : array-like of length 2
-		[channel0_sample, channel1_sample].
+# Real FFT size (N) implied by FFT_SIZE bins: N = 2*(bins-1)
+FFT_REAL_SIZE = 2 * (frame_schema.FFT_SIZE - 1)
 
-	Returns
-	-------
-	list of two numpy.ndarray
-		The updated arrays (same structure as array).
-	"""
-	array[0] = update_data_t(array[0], data[0])
-	array[1] = update_data_t(array[1], data[1])
-	return array
+# 0..Nyquist FFT axis (len=FFT_SIZE) for 125e6 sample rate; shared and read-only
+F_AXIS = np.arange(frame_schema.FFT_SIZE, dtype=np.float64) * (125e6 / FFT_REAL_SIZE)
+F_AXIS.setflags(write=False)
+
+# Two-channel time series kept in DataPackage ring buffers (attribute <name>_t)
+_SERIES = ("pir", "q", "i", "piezo", "temp", "freqerr", "beatfreq")
+
+
+def _frame_array(raw_data) -> Optional[np.ndarray]:
+	"""View/convert a raw frame as FRAME_SIZE_DOUBLES float64 values, or None if invalid."""
+	if raw_data is None:
+		return None
+	if isinstance(raw_data, (bytes, bytearray, memoryview)):
+		if memoryview(raw_data).nbytes != frame_schema.FRAME_SIZE_BYTES:
+			return None
+		return np.frombuffer(raw_data, dtype="<f8", count=frame_schema.FRAME_SIZE_DOUBLES)
+	arr = np.ascontiguousarray(raw_data, dtype=np.float64)
+	if arr.shape != (frame_schema.FRAME_SIZE_DOUBLES,):
+		return None
+	return arr
+
+
+def _frame_spectra(arr: np.ndarray) -> np.ndarray:
+	"""Uncalibrated (2, FFT_SIZE) view of both spectra (the channels are adjacent)."""
+	start = frame_schema.FFT_RESULT_CHAN1_START
+	stop = frame_schema.FFT_RESULT_CHAN2_START + frame_schema.FFT_SIZE
+	return arr[start:stop].reshape(2, frame_schema.FFT_SIZE)
+
+
+def _frame_tail(arr: np.ndarray) -> np.ndarray:
+	"""(7, 2) view of the tail fields, rows in _SERIES order (no copy)."""
+	return arr[frame_schema.TAIL_START:_TAIL_STOP].reshape(len(_SERIES), 2)
 
 
 @dataclass
@@ -91,7 +117,7 @@ class Frame:
 	logic is encapsulated in DataPackage.parse_frame().
 	"""
 	cnt: int
-	spectrum: List[np.ndarray]  # [channel0, channel1], each FFT_SIZE floats
+	spectrum: np.ndarray  # shape (2, FFT_SIZE): [channel0, channel1]
 	pir: np.ndarray  # [channel0, channel1]
 	q: np.ndarray  # [channel0, channel1]
 	i: np.ndarray  # [channel0, channel1]
@@ -100,26 +126,51 @@ class Frame:
 	freqerr: np.ndarray  # [channel0, channel1]
 	beatfreq: np.ndarray  # [channel0, channel1]
 
+	@classmethod
+	def empty(cls) -> "Frame":
+		"""Zeroed Frame with preallocated arrays, to reuse via parse_frame(raw, out=frame)."""
+		pir, q, i, piezo, temp, freqerr, beatfreq = np.zeros((len(_SERIES), 2))
+		return cls(0, np.zeros((2, frame_schema.FFT_SIZE)), pir, q, i, piezo, temp, freqerr, beatfreq)
+
 
 @dataclass
 class PlotViewModel:
-	"""Minimal data for updating plots. Built from DataPackage so gui.py does not depend on dataset structure."""
+	"""Minimal data for updating plots. Built from DataPackage so gui.py does not depend on dataset structure.
+
+	Arrays are owned copies that later frames never write to: pyqtgraph keeps
+	the arrays given to setData by reference and re-reads them on pan/zoom
+	(clipToView, downsampling), so a drawn curve must not change underneath.
+	rev_spectrum / rev_t carry the dataset revisions so the GUI can skip
+	redrawing unchanged plots (None means unknown: always redraw).
+	"""
 	f: np.ndarray  # Fourier frequencies
-	spectrum: List[np.ndarray]  # [channel0, channel1]
+	spectrum: np.ndarray  # shape (2, FFT_SIZE): [channel0, channel1]
 	pir: np.ndarray  # [channel0, channel1]
 	beatfreq: np.ndarray  # [channel0, channel1] FFT peak frequencies (Hz)
 	t: np.ndarray  # time axis
-	i_t: List[np.ndarray]
-	q_t: List[np.ndarray]
-	freqerr_t: List[np.ndarray]
-	freq_plot_t: List[np.ndarray]
-	piezo_t: List[np.ndarray]
-	temp_t: List[np.ndarray]
+	# Time series below have shape (2, TIME_PNTS): [channel0, channel1]
+	i_t: np.ndarray
+	q_t: np.ndarray
+	freqerr_t: np.ndarray
+	freq_plot_t: np.ndarray
+	piezo_t: np.ndarray
+	temp_t: np.ndarray
+	rev_spectrum: Optional[int] = None  # DataPackage.rev_snapshot
+	rev_t: Optional[int] = None  # DataPackage.rev_t
 
 
-_HEALTH_GREEN = "green"
-_HEALTH_YELLOW = "yellow"
-_HEALTH_RED = "red"
+class HealthLevel(IntEnum):
+	"""Health indicator level; a worse level compares greater, so combining is max()."""
+	GREEN = 0
+	YELLOW = 1
+	RED = 2
+
+
+# HealthSnapshot strings, indexed by HealthLevel
+_HEALTH_STR = ("green", "yellow", "red")
+
+# Plain-int codes for the (optionally compiled) scalar core
+_GREEN, _YELLOW, _RED = int(HealthLevel.GREEN), int(HealthLevel.YELLOW), int(HealthLevel.RED)
 
 
 @dataclass
@@ -133,32 +184,63 @@ class HealthSnapshot:
 	ctrl: str
 
 
-def _combine_health(levels: List[str]) -> str:
-	"""Return the worst health level in a list (red > yellow > green)."""
-	if _HEALTH_RED in levels:
-		return _HEALTH_RED
-	if _HEALTH_YELLOW in levels:
-		return _HEALTH_YELLOW
-	return _HEALTH_GREEN
+def _fft_peak_frequency(spectrum: np.ndarray, f_axis: np.ndarray) -> float:
+	"""
+	Return FFT peak frequency (Hz) from spectrum argmax.
 
+	Contract: spectrum and f_axis are FFT_SIZE long (callers check the FFT
+	data first); the check only runs with _DEBUG set and is stripped by -O.
+	"""
+	if __debug__ and _DEBUG:
+		assert len(spectrum) == len(f_axis) == frame_schema.FFT_SIZE
+	return float(f_axis[int(np.argmax(spectrum))])
 
-def _fft_peak_frequency(spectrum: np.ndarray, f_axis: np.ndarray) -> float:
-	"""Return FFT peak frequency (Hz) from spectrum argmax or 0.0 if invalid."""
+def _unchecked_peak_frequency(spectrum, f_axis) -> float:
+	"""
+	Return the spectrum argmax frequency (Hz) for FFT data that failed _fft_data_ok.
+
+	Returns 0.0 when spectrum or f_axis is missing or empty, or when the
+	argmax bin lies beyond f_axis.
+	"""
 	if spectrum is None or f_axis is None or len(spectrum) == 0 or len(f_axis) == 0:
 		return 0.0
 	idx = int(np.argmax(spectrum))
-	if idx < 0 or idx >= len(f_axis):
-		return 0.0
-	return float(f_axis[idx])
+	return float(f_axis[idx]) if idx < len(f_axis) else 0.0
 
 def _fft_real_size() -> int:
 	"""Return the real FFT size (N) implied by 513 bins: N = 2*(bins-1)."""
-	return 2 * (frame_schema.FFT_SIZE - 1)
+	return FFT_REAL_SIZE
 
 def _fft_frequency_axis() -> np.ndarray:
-	"""Return 0..Nyquist FFT axis (len=FFT_SIZE) for 125e6 sample rate."""
-	fft_real_size = _fft_real_size()
-	return np.arange(frame_schema.FFT_SIZE, dtype=float) * 125e6 / fft_real_size
+	"""Return the cached, read-only 0..Nyquist FFT axis (F_AXIS)."""
+	return F_AXIS
+
+
+_SPECTRUM_MAX = 1e6  # Vpp; larger magnitudes mean tail values read as FFT bins
+
+
+def _spectrum_ok_numpy(spectrum: np.ndarray) -> bool:
+	"""True if every bin is finite and in [0, _SPECTRUM_MAX] (min/max propagate NaN)."""
+	return bool(spectrum.min() >= 0.0 and spectrum.max() <= _SPECTRUM_MAX)
+
+
+if njit is not None:
+	_SPECTRUM_OK_SIGNATURES = [
+		nb_types.boolean(nb_types.Array(nb_types.float64, 1, "C", readonly=readonly))
+		for readonly in (False, True)
+	]
+
+	# No fastmath: the NaN/inf rejection relies on IEEE comparisons.
+	@njit(_SPECTRUM_OK_SIGNATURES, cache=True, boundscheck=False)
+	def _spectrum_ok(spectrum):
+		"""Single pass over spectrum; stops at the first non-finite or out-of-range bin."""
+		for k in range(spectrum.shape[0]):
+			v = spectrum[k]
+			if not (v >= 0.0 and v <= _SPECTRUM_MAX):
+				return False
+		return True
+else:
+	_spectrum_ok = _spectrum_ok_numpy
 
 
 def _fft_data_ok(dataset) -> bool:
@@ -166,112 +248,126 @@ def _fft_data_ok(dataset) -> bool:
 	if dataset is None:
 		return False
 	f_axis = dataset.f
-	if f_axis is None or len(f_axis) != frame_schema.FFT_SIZE:
-		return False
-	if not np.all(np.isfinite(f_axis)):
-		return False
-	expected_f = _fft_frequency_axis()
-	if np.any(f_axis < 0.0) or np.any(f_axis > expected_f[-1]):
-		return False
-	if not np.allclose(f_axis, expected_f):
-		return False
-	for spectrum in dataset.spectrum:
-		if spectrum is None or len(spectrum) != frame_schema.FFT_SIZE:
+	# The shared read-only F_AXIS is valid by construction; only foreign axes
+	# (e.g. loaded from disk) pay for the element-wise checks.
+	if f_axis is not F_AXIS:
+		if f_axis is None or len(f_axis) != frame_schema.FFT_SIZE:
 			return False
-		if not np.all(np.isfinite(spectrum)):
+		f_axis = np.asarray(f_axis, dtype=np.float64)
+		# allclose rejects NaN/inf; min/max enforce the strict 0..Nyquist range
+		if not (f_axis.min() >= 0.0 and f_axis.max() <= F_AXIS[-1]
+				and np.allclose(f_axis, F_AXIS)):
 			return False
-		if np.any(spectrum < 0.0) or np.any(spectrum > 1e6):
+	spectrum = dataset.spectrum
+	if not isinstance(spectrum, np.ndarray):
+		if any(s is None or len(s) != frame_schema.FFT_SIZE for s in spectrum):
 			return False
-	return True
+		spectrum = np.asarray(spectrum, dtype=np.float64)
+	if spectrum.ndim != 2 or spectrum.shape[1] != frame_schema.FFT_SIZE:
+		return False
+	# Both channels in one pass over the (2, FFT_SIZE) block
+	return _spectrum_ok(np.ascontiguousarray(spectrum, dtype=np.float64).reshape(-1))
 
 
-def compute_health_snapshot(dataset, is_phasemeter: bool) -> HealthSnapshot:
+def _health_core_py(i, q, pir, peak0, peak1, freqerr, piezo, temp, is_phasemeter):
 	"""
-	Compute top-bar health indicators from the current dataset.
+	Scalar health rules for both channels, as integer HealthLevel codes.
 
-	Parameters
-	----------
-	dataset : DataPackage
-		Current snapshot values and FFT data.
-	is_phasemeter : bool
-		True when connected to a phasemeter-only server.
+	Returns (i_value, q_value, freq_readout, freq_error, ctrl); each is the worst
+	of the two channels. Comparisons are written so NaN falls through exactly
+	like the original per-channel rules.
 	"""
-	fft_status = _HEALTH_GREEN if _fft_data_ok(dataset) else _HEALTH_RED
-
-	i_levels = []
-	for val in dataset.i:
+	i_status = _GREEN
+	q_status = _GREEN
+	for ch in range(2):
+		val = i[ch]
 		if val < 0.0:
-			i_levels.append(_HEALTH_RED)
+			i_status = max(i_status, _RED)
 		elif val <= 1e-3:
-			i_levels.append(_HEALTH_YELLOW)
-		else:
-			i_levels.append(_HEALTH_GREEN)
-	i_status = _combine_health(i_levels)
+			i_status = max(i_status, _YELLOW)
 
-	q_levels = []
-	for val in dataset.q:
-		abs_val = abs(val)
+		abs_val = abs(q[ch])
 		if abs_val > 1.0:
-			q_levels.append(_HEALTH_RED)
-		elif abs_val <= 1e-9:
-			q_levels.append(_HEALTH_GREEN)
-		elif abs_val < 1.0:
-			q_levels.append(_HEALTH_YELLOW)
-		else:
-			q_levels.append(_HEALTH_YELLOW)
-	q_status = _combine_health(q_levels)
+			q_status = max(q_status, _RED)
+		elif not abs_val <= 1e-9:
+			q_status = max(q_status, _YELLOW)
 
+	freq_readout_status = _GREEN
+	freq_error_status = _GREEN
+	ctrl_status = _GREEN
 	if is_phasemeter:
-		readout_levels = []
 		for ch in range(2):
-			readout = float(dataset.pir[ch])
-			peak = _fft_peak_frequency(dataset.spectrum[ch], dataset.f)
+			readout = pir[ch]
+			peak = peak0 if ch == 0 else peak1
 			if readout < 0.0:
-				readout_levels.append(_HEALTH_RED)
-			elif readout == 0.0:
-				readout_levels.append(_HEALTH_YELLOW)
-			elif peak > 0.0 and abs(readout - peak) <= 0.1 * peak:
-				readout_levels.append(_HEALTH_GREEN)
-			else:
-				readout_levels.append(_HEALTH_YELLOW)
-		freq_readout_status = _combine_health(readout_levels)
-		freq_error_status = _HEALTH_GREEN
-		ctrl_status = _HEALTH_GREEN
+				freq_readout_status = max(freq_readout_status, _RED)
+			elif not (peak > 0.0 and abs(readout - peak) <= 0.1 * peak):
+				freq_readout_status = max(freq_readout_status, _YELLOW)
 	else:
-		freq_readout_status = _HEALTH_GREEN
-		freqerr_levels = []
-		for val in dataset.freqerr:
-			abs_val = abs(val)
-			if abs_val > 1.0:
-				freqerr_levels.append(_HEALTH_RED)
-			elif 0.0 < abs_val < 1e-6:
-				freqerr_levels.append(_HEALTH_GREEN)
-			elif 1e-6 < abs_val < 1.0:
-				freqerr_levels.append(_HEALTH_YELLOW)
-			else:
-				freqerr_levels.append(_HEALTH_YELLOW)
-		freq_error_status = _combine_health(freqerr_levels)
-
-		ctrl_levels = []
 		for ch in range(2):
-			max_abs = max(abs(dataset.piezo[ch]), abs(dataset.temp[ch]))
+			abs_val = abs(freqerr[ch])
+			if abs_val > 1.0:
+				freq_error_status = max(freq_error_status, _RED)
+			elif not 0.0 < abs_val < 1e-6:
+				freq_error_status = max(freq_error_status, _YELLOW)
+
+			# Python max() semantics: keep the first operand unless the second is larger
+			max_abs = abs(piezo[ch])
+			abs_temp = abs(temp[ch])
+			if abs_temp > max_abs:
+				max_abs = abs_temp
 			if max_abs > 1.0:
-				ctrl_levels.append(_HEALTH_RED)
-			elif 0.0 < max_abs < 0.5:
-				ctrl_levels.append(_HEALTH_GREEN)
-			elif 0.5 < max_abs < 1.0:
-				ctrl_levels.append(_HEALTH_YELLOW)
-			else:
-				ctrl_levels.append(_HEALTH_YELLOW)
-		ctrl_status = _combine_health(ctrl_levels)
+				ctrl_status = max(ctrl_status, _RED)
+			elif not 0.0 < max_abs < 0.5:
+				ctrl_status = max(ctrl_status, _YELLOW)
+
+	return i_status, q_status, freq_readout_status, freq_error_status, ctrl_status
+
+
+if njit is not None:
+	_ARR = nb_types.Array(nb_types.float64, 1, "A")
+	_HEALTH_CORE_SIGNATURE = nb_types.UniTuple(nb_types.int64, 5)(
+		_ARR, _ARR, _ARR, nb_types.float64, nb_types.float64,
+		_ARR, _ARR, _ARR, nb_types.boolean,
+	)
+	_health_core = njit(_HEALTH_CORE_SIGNATURE, cache=True)(_health_core_py)
+else:
+	_health_core = _health_core_py
 
+
+def compute_health_snapshot(dataset, is_phasemeter: bool) -> HealthSnapshot:
+	"""
+	Compute top-bar health indicators from the current dataset.
+
+	Parameters
+	----------
+	dataset : DataPackage
+		Current snapshot values and FFT data.
+	is_phasemeter : bool
+		True when connected to a phasemeter-only server.
+	"""
+	fft_status = HealthLevel.GREEN if _fft_data_ok(dataset) else HealthLevel.RED
+	# The readout is compared with the spectrum argmax even when the FFT check
+	# is red; unvalidated data only goes through the shape-guarded lookup.
+	if not is_phasemeter:
+		peak0 = peak1 = 0.0
+	elif fft_status == HealthLevel.GREEN:
+		peak0 = _fft_peak_frequency(dataset.spectrum[0], dataset.f)
+		peak1 = _fft_peak_frequency(dataset.spectrum[1], dataset.f)
+	else:
+		peak0 = _unchecked_peak_frequency(dataset.spectrum[0], dataset.f)
+		peak1 = _unchecked_peak_frequency(dataset.spectrum[1], dataset.f)
+	codes = _health_core(
+		dataset.i, dataset.q, dataset.pir, peak0, peak1,
+		dataset.freqerr, dataset.piezo, dataset.temp, bool(is_phasemeter),
+	)
 	return HealthSnapshot(
-		fft=fft_status,
-		i_value=i_status,
-		q_value=q_status,
-		freq_readout=freq_readout_status,
-		freq_error=freq_error_status,
-		ctrl=ctrl_status,
+		fft=_HEALTH_STR[fft_status],
+		i_value=_HEALTH_STR[codes[0]],
+		q_value=_HEALTH_STR[codes[1]],
+		freq_readout=_HEALTH_STR[codes[2]],
+		freq_error=_HEALTH_STR[codes[3]],
+		ctrl=_HEALTH_STR[codes[4]],
 	)
 def effective_beatfreq(spectrum: np.ndarray, beatfreq_val: float, f_axis: np.ndarray,
                        freq_thresh: float = 1e3, spec_thresh: float = 1e-5,
@@ -307,10 +403,58 @@ def effective_beatfreq(spectrum: np.ndarray, beatfreq_val: float, f_axis: np.nda
         used_fallback is True when client-side argmax was used instead of server.
     """
     argmax_freq = 0.0
-    if len(spectrum) > 0 and np.max(spectrum) >= spec_thresh:
+    if len(spectrum) > 0:
+        # One pass: argmax also locates the max (and the first NaN, if any)
         idx = int(np.argmax(spectrum))
-        argmax_freq = float(f_axis[idx]) if idx < len(f_axis) else 0.0
+        if spectrum[idx] >= spec_thresh:
+            argmax_freq = float(f_axis[idx]) if idx < len(f_axis) else 0.0
+    return _resolve_beatfreq(argmax_freq, beatfreq_val, freq_thresh, max_discrepancy_hz)
+
+
+def effective_beatfreq_batch(spectrum: np.ndarray, beatfreq: np.ndarray, f_axis: np.ndarray,
+                             freq_thresh: float = 1e3, spec_thresh: float = 1e-5,
+                             max_discrepancy_hz: float = 2e6) -> tuple:
+    """
+    effective_beatfreq for both channels with a single argmax over the (2, N) block.
 
+    Parameters
+    ----------
+    spectrum : np.ndarray
+        FFT magnitude spectra, shape (2, N).
+    beatfreq : np.ndarray
+        Server-reported peak frequencies (Hz), shape (2,).
+    f_axis : np.ndarray
+        Frequency axis (Hz) for spectrum bins.
+    freq_thresh, spec_thresh, max_discrepancy_hz : float, optional
+        As for effective_beatfreq.
+
+    Returns
+    -------
+    tuple of (tuple, tuple)
+        ((eff0, eff1), (used_fallback0, used_fallback1)), per channel as
+        returned by effective_beatfreq.
+    """
+    idxs = np.argmax(spectrum, axis=1) if spectrum.shape[1] > 0 else None
+    n_f = len(f_axis)
+    effs = []
+    fallbacks = []
+    for ch in range(spectrum.shape[0]):
+        argmax_freq = 0.0
+        if idxs is not None:
+            idx = int(idxs[ch])
+            if spectrum[ch, idx] >= spec_thresh:
+                argmax_freq = float(f_axis[idx]) if idx < n_f else 0.0
+        eff, fallback = _resolve_beatfreq(
+            argmax_freq, beatfreq[ch], freq_thresh, max_discrepancy_hz
+        )
+        effs.append(eff)
+        fallbacks.append(fallback)
+    return tuple(effs), tuple(fallbacks)
+
+
+def _resolve_beatfreq(argmax_freq: float, beatfreq_val: float, freq_thresh: float,
+                      max_discrepancy_hz: float) -> tuple:
+    """Choose between the server peak and the spectrum argmax (see effective_beatfreq)."""
     if beatfreq_val >= freq_thresh:
         if argmax_freq > 0 and abs(beatfreq_val - argmax_freq) > max_discrepancy_hz:
             return (argmax_freq, True)
@@ -319,22 +463,24 @@ def effective_beatfreq(spectrum: np.ndarray, beatfreq_val: float, f_axis: np.nda
 
 
 def compute_freq_plot_t(dataset, is_phasemeter: bool,
-                        ref_freqs_hz: Optional[List[float]] = None) -> List[np.ndarray]:
+                        ref_freqs_hz: Optional[Union[List[float], np.ndarray]] = None) -> np.ndarray:
 	"""
 	Compute the time-series data for the frequency plot.
 
 	In phasemeter mode, plot PIR (Hz). In laser-lock mode, plot PIR minus
-	reference frequency setpoints (Hz).
+	reference frequency setpoints (Hz). Returns a new (2, TIME_PNTS) array
+	that nothing writes to afterwards, so it can be handed to the plots (see
+	PlotViewModel); the subtraction is one broadcast over both channels.
 	"""
 	if is_phasemeter:
-		return dataset.pir_t
+		return dataset.pir_t.copy()
 
-	ref0 = float(ref_freqs_hz[0]) if ref_freqs_hz and len(ref_freqs_hz) > 0 else 0.0
-	ref1 = float(ref_freqs_hz[1]) if ref_freqs_hz and len(ref_freqs_hz) > 1 else 0.0
-	return [
-		dataset.pir_t[0] - ref0,
-		dataset.pir_t[1] - ref1,
-	]
+	n_refs = len(ref_freqs_hz) if ref_freqs_hz is not None else 0
+	ref0 = float(ref_freqs_hz[0]) if n_refs > 0 else 0.0
+	ref1 = float(ref_freqs_hz[1]) if n_refs > 1 else 0.0
+	if ref0 == 0.0 and ref1 == 0.0:
+		return dataset.pir_t.copy()  # nothing to subtract
+	return np.subtract(dataset.pir_t, ((ref0,), (ref1,)))
 
 
 def infer_phasemeter_from_snapshot(dataset, freq_tol_hz: float = 1e-6,
@@ -349,16 +495,23 @@ def infer_phasemeter_from_snapshot(dataset, freq_tol_hz: float = 1e-6,
 	freqerr = dataset.freqerr
 	if pir is None or freqerr is None:
 		return False
-	freq_match = np.all(np.abs(freqerr - pir) <= freq_tol_hz)
+	# Two channels: plain scalar math beats NumPy dispatch on 2-element arrays
+	p0, p1 = float(pir[0]), float(pir[1])
+	piezo = dataset.piezo
+	temp = dataset.temp
+	freq_match = (
+		abs(float(freqerr[0]) - p0) <= freq_tol_hz
+		and abs(float(freqerr[1]) - p1) <= freq_tol_hz
+	)
 	ctrl_zero = (
-		np.all(np.abs(dataset.piezo) <= ctrl_tol)
-		and np.all(np.abs(dataset.temp) <= ctrl_tol)
+		abs(float(piezo[0])) <= ctrl_tol and abs(float(piezo[1])) <= ctrl_tol
+		and abs(float(temp[0])) <= ctrl_tol and abs(float(temp[1])) <= ctrl_tol
 	)
-	pir_nonzero = np.any(np.abs(pir) >= min_pir_hz)
+	pir_nonzero = abs(p0) >= min_pir_hz or abs(p1) >= min_pir_hz
 	return bool(freq_match and ctrl_zero and pir_nonzero)
 
 
-def build_plot_view_model(dataset, freq_plot_t: Optional[List[np.ndarray]] = None) -> PlotViewModel:
+def build_plot_view_model(dataset, freq_plot_t: Optional[np.ndarray] = None) -> PlotViewModel:
 	"""
 	Build a view model for plots from a DataPackage.
 
@@ -369,28 +522,34 @@ def build_plot_view_model(dataset, freq_plot_t: Optional[List[np.ndarray]] = Non
 
 	Parameters
 	----------
-	freq_plot_t : list of numpy.ndarray, optional
+	freq_plot_t : numpy.ndarray, optional
 		Override for the frequency plot data; defaults to dataset.freqerr_t.
+		Must be an array the caller no longer writes to (see
+		compute_freq_plot_t).
 
 	Returns
 	-------
 	PlotViewModel
-		View model with references to dataset arrays (no copy).
+		View model holding copies of the dataset arrays (f is the shared,
+		read-only axis).
 	"""
+	t, series = dataset.copy_window()
 	if freq_plot_t is None:
-		freq_plot_t = dataset.freqerr_t
+		freq_plot_t = series["freqerr"]
 	return PlotViewModel(
 		f=dataset.f,
-		spectrum=dataset.spectrum,
-		pir=dataset.pir,
-		beatfreq=dataset.beatfreq,
-		t=dataset.t,
-		i_t=dataset.i_t,
-		q_t=dataset.q_t,
-		freqerr_t=dataset.freqerr_t,
+		spectrum=np.array(dataset.spectrum),
+		pir=np.array(dataset.pir),
+		beatfreq=np.array(dataset.beatfreq),
+		t=t,
+		i_t=series["i"],
+		q_t=series["q"],
+		freqerr_t=series["freqerr"],
 		freq_plot_t=freq_plot_t,
-		piezo_t=dataset.piezo_t,
-		temp_t=dataset.temp_t,
+		piezo_t=series["piezo"],
+		temp_t=series["temp"],
+		rev_spectrum=dataset.rev_snapshot,
+		rev_t=dataset.rev_t,
 	)
 
 
@@ -398,122 +557,198 @@ class DataPackage:
 	def __init__(self):
 		"""Initialize empty dataset and time-series arrays for two channels."""
 		self.cnt = 0  # count
-		self.spectrum = [np.zeros(frame_schema.FFT_SIZE) for i in range(2)] # specrtrums
-		self.pir = np.zeros(2)  # pir frequencies
-		self.q = np.zeros(2)    # Q values
-		self.i = np.zeros(2)    # I values
-		self.piezo = np.zeros(2) # Piezo control signals
-		self.temp = np.zeros(2) # temperature control signals
-		self.freqerr = np.zeros(2) # pir frequency errors
-		self.beatfreq = np.zeros(2)  # beatnote frequencies
+		# Revision counters, bumped whenever the snapshot / time series change
+		self.rev_snapshot = 0
+		self.rev_t = 0
+		# Snapshot arrays are row views into two contiguous blocks
+		self._spec_block = np.zeros((2, frame_schema.FFT_SIZE))
+		self.spectrum = self._spec_block # specrtrums, shape (2, FFT_SIZE)
+		self._tail_block = np.zeros((len(_SERIES), 2))  # rows in _SERIES order
+		(
+			self.pir,      # pir frequencies
+			self.q,        # Q values
+			self.i,        # I values
+			self.piezo,    # Piezo control signals
+			self.temp,     # temperature control signals
+			self.freqerr,  # pir frequency errors
+			self.beatfreq, # beatnote frequencies
+		) = self._tail_block
 
 		# --- GUI-related --------------------------------------
-		self.f = _fft_frequency_axis()  # Fourier frequencies: bin k at k*fs/N
-		self.t = np.linspace(0,1, glp.TIME_PNTS) # time
-		self.pir_t = [np.zeros(glp.TIME_PNTS) for i in range(2)]
-		self.q_t = [np.zeros(glp.TIME_PNTS) for i in range(2)]
-		self.i_t = [np.zeros(glp.TIME_PNTS) for i in range(2)]
-		self.piezo_t = [np.zeros(glp.TIME_PNTS) for i in range(2)]
-		self.temp_t = [np.zeros(glp.TIME_PNTS) for i in range(2)]
-		self.freqerr_t = [np.zeros(glp.TIME_PNTS) for i in range(2)]
-		self.beatfreq_t = [np.zeros(glp.TIME_PNTS) for i in range(2)]
+		self.f = F_AXIS  # Fourier frequencies: bin k at k*fs/N (shared, read-only)
+		# Time series live in mirrored ring buffers of length 2*N: each sample is
+		# written at head and head+N, so buf[head:head+N] is always the window in
+		# chronological order, without copying. t and the (2, N) pir_t, ... are
+		# views into them.
+		n = glp.TIME_PNTS
+		self._n = n
+		self._head = 0
+		self._t_buf = np.tile(np.linspace(0, 1, n), 2)
+		self._ts_block = np.zeros((len(_SERIES), 2, 2 * n))
+		self._bind_series()
+
+	def _bind_series(self) -> None:
+		"""Point t and the <name>_t series at the current ring-buffer window."""
+		h = self._head
+		n = self._n
+		self.t = self._t_buf[h:h + n] # time
+		for name, buf in zip(_SERIES, self._ts_block):
+			setattr(self, name + "_t", buf[:, h:h + n])
+
+	def copy_window(self) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+		"""
+		Copy the current time-series window out of the ring buffers.
+
+		The ring overwrites slots in place, so t and the <name>_t views change
+		under anyone holding them; callers that keep the arrays (the plots)
+		take this copy instead.
+
+		Returns
+		-------
+		tuple of (numpy.ndarray, dict)
+			Copy of t, and a dict mapping each series name (e.g. "pir") to a
+			copy of its (2, TIME_PNTS) window. All series come from one copy.
+		"""
+		h = self._head
+		n = self._n
+		block = self._ts_block[:, :, h:h + n].copy()
+		return self._t_buf[h:h + n].copy(), dict(zip(_SERIES, block))
 
 	def clear(self) -> None:
 		"""Reset all data to initial state (zeros), clearing plots."""
 		self.cnt = 0
-		for i in range(2):
-			self.spectrum[i].fill(0)
-		self.pir.fill(0)
-		self.q.fill(0)
-		self.i.fill(0)
-		self.piezo.fill(0)
-		self.temp.fill(0)
-		self.freqerr.fill(0)
-		self.beatfreq.fill(0)
-		self.t = np.linspace(0, 1, glp.TIME_PNTS)
-		for i in range(2):
-			self.pir_t[i].fill(0)
-			self.q_t[i].fill(0)
-			self.i_t[i].fill(0)
-			self.piezo_t[i].fill(0)
-			self.temp_t[i].fill(0)
-			self.freqerr_t[i].fill(0)
-			self.beatfreq_t[i].fill(0)
+		self._spec_block.fill(0)
+		self._tail_block.fill(0)
+		self._ts_block.fill(0)
+		self._head = 0
+		self._t_buf[:] = np.tile(np.linspace(0, 1, self._n), 2)
+		self._bind_series()
+		self.rev_snapshot += 1
+		self.rev_t += 1
 
 	@staticmethod
-	def parse_frame(raw_data: List[float]) -> Optional[Frame]:
+	def parse_frame(raw_data: Union[bytes, np.ndarray, List[float], None],
+	                out: Optional[Frame] = None) -> Optional[Frame]:
 		"""
-		Parse raw frame data (list of doubles) into a Frame object.
+		Parse raw frame data into a Frame object.
 
 		Single place where frame parsing logic lives. Returns None if
 		raw_data is invalid (None or wrong length).
 
 		Parameters
 		----------
-		raw_data : list of float or None
-			Exactly FRAME_SIZE_DOUBLES doubles, or None.
+		raw_data : bytes-like, numpy.ndarray, list of float or None
+			Exactly FRAME_SIZE_BYTES little-endian bytes (viewed without
+			copying), or exactly FRAME_SIZE_DOUBLES doubles, or None.
+		out : Frame, optional
+			Caller-owned Frame (e.g. from Frame.empty()) to fill in place and
+			return, so a long-running loop allocates nothing per frame. Left
+			untouched if raw_data is invalid.
 
 		Returns
 		-------
 		Frame or None
 			Parsed frame with calibrated spectrum and tail fields, or None.
+			The Frame owns its data (no views into raw_data).
 		"""
-		if raw_data is None or len(raw_data) != frame_schema.FRAME_SIZE_DOUBLES:
+		arr = _frame_array(raw_data)
+		if arr is None:
 			return None
-		
-		# Parse FFT spectra (apply calibration factor)
-		spectrum_0 = np.array([
-			raw_data[frame_schema.FFT_RESULT_CHAN1_START + i] * glp.ABS_CAL_FACTOR
-			for i in range(frame_schema.FFT_SIZE)
-		])
-		spectrum_1 = np.array([
-			raw_data[frame_schema.FFT_RESULT_CHAN2_START + i] * glp.ABS_CAL_FACTOR
-			for i in range(frame_schema.FFT_SIZE)
-		])
-		
-		# Parse tail fields (must match `server/esw/memory_map.h::FRAME_CONTENT_ADDRESS_OFFSET`)
+		if out is not None:
+			out.cnt = int(arr[frame_schema.FRAME_COUNTER])
+			np.multiply(_frame_spectra(arr), glp.ABS_CAL_FACTOR, out=out.spectrum)
+			tail = _frame_tail(arr)
+			out.pir[:] = tail[0]
+			out.q[:] = tail[1]
+			out.i[:] = tail[2]
+			out.piezo[:] = tail[3]
+			out.temp[:] = tail[4]
+			out.freqerr[:] = tail[5]
+			out.beatfreq[:] = tail[6]
+			return out
+
+		# One structured view of the whole frame
+		rec = arr.view(FRAME_DTYPE)[0]
+		# Copy the 14 tail doubles once (one allocation) so the Frame does not
+		# alias raw_data, which may be a reused receive buffer; fields are rows.
+		pir, q, i, piezo, temp, freqerr, beatfreq = _frame_tail(arr).copy()
 		return Frame(
-			cnt=int(raw_data[frame_schema.FRAME_COUNTER]),
-			spectrum=[spectrum_0, spectrum_1],
-			pir=np.array([raw_data[frame_schema.PLL0PIR], raw_data[frame_schema.PLL1PIR]]),
-			q=np.array([raw_data[frame_schema.PLL0Q], raw_data[frame_schema.PLL1Q]]),
-			i=np.array([raw_data[frame_schema.PLL0I], raw_data[frame_schema.PLL1I]]),
-			piezo=np.array([raw_data[frame_schema.PIEZO_ACT0], raw_data[frame_schema.PIEZO_ACT1]]),
-			temp=np.array([raw_data[frame_schema.TEMP_ACT0], raw_data[frame_schema.TEMP_ACT1]]),
-			freqerr=np.array([raw_data[frame_schema.FREQ_ERR0], raw_data[frame_schema.FREQ_ERR1]]),
-			beatfreq=np.array([raw_data[frame_schema.MAX_ABS_FREQ0], raw_data[frame_schema.MAX_ABS_FREQ1]]),
+			cnt=int(rec["cnt"]),
+			spectrum=rec["spectrum"] * glp.ABS_CAL_FACTOR,  # apply calibration factor
+			pir=pir,
+			q=q,
+			i=i,
+			piezo=piezo,
+			temp=temp,
+			freqerr=freqerr,
+			beatfreq=beatfreq,
 		)
 
-	def substitute_data(self, data: Union[List[float], Frame, None]):
+	def parse_into(self, raw_data: Union[bytes, np.ndarray, List[float], None]) -> bool:
+		"""
+		Parse a raw frame straight into this DataPackage's snapshot arrays.
+
+		Same layout and validation as parse_frame, but the calibrated spectra
+		and tail fields are written into the existing blocks: no Frame and no
+		intermediate arrays are allocated.
+
+		Parameters
+		----------
+		raw_data : bytes-like, numpy.ndarray, list of float or None
+			Raw frame, as accepted by parse_frame.
+
+		Returns
+		-------
+		bool
+			True if the frame was valid and stored, False otherwise.
+		"""
+		arr = _frame_array(raw_data)
+		if arr is None:
+			return False
+		self.cnt = int(arr[frame_schema.FRAME_COUNTER])
+		np.multiply(_frame_spectra(arr), glp.ABS_CAL_FACTOR, out=self._spec_block)
+		self._tail_block[:] = _frame_tail(arr)
+		self.rev_snapshot += 1
+		return True
+
+	def substitute_data(self, data: Union[bytes, np.ndarray, List[float], Frame, None]):
 		"""
 		Update this DataPackage with new frame data.
 
-		Accepts raw frame list (parsed via parse_frame), a Frame object,
-		or None (no-op).
+		Accepts a raw frame (bytes, array or list; parsed via parse_frame),
+		a Frame object, or None (no-op). Callers that know the input type
+		should call substitute_raw or substitute_frame directly.
 
 		Parameters
 		----------
-		data : list of float, Frame, or None
-			Raw frame list, already-parsed Frame, or None.
+		data : bytes-like, numpy.ndarray, list of float, Frame, or None
+			Raw frame, already-parsed Frame, or None.
 
 		Returns
 		-------
 		None
 		"""
-		# Parse raw data if needed
-		if isinstance(data, Frame):
-			frame = data
-		elif data is None:
+		if data is None:
 			return
+		if isinstance(data, Frame):
+			self.substitute_frame(data)
 		else:
-			frame = self.parse_frame(data)
-			if frame is None:
-				return
-		
-		# Update current snapshot
+			self.parse_into(data)
+
+	# Raw-frame fast path (no type dispatch); returns True if the frame was stored
+	substitute_raw = parse_into
+
+	def substitute_frame(self, frame: Frame) -> None:
+		"""
+		Update the current snapshot from an already-parsed Frame.
+
+		Parameters
+		----------
+		frame : Frame
+			Parsed frame (e.g. from parse_frame).
+		"""
 		self.cnt = frame.cnt
-		self.spectrum[0][:] = frame.spectrum[0]
-		self.spectrum[1][:] = frame.spectrum[1]
+		np.copyto(self.spectrum, frame.spectrum)
 		self.pir[:] = frame.pir
 		self.q[:] = frame.q
 		self.i[:] = frame.i
@@ -521,18 +756,46 @@ class DataPackage:
 		self.temp[:] = frame.temp
 		self.freqerr[:] = frame.freqerr
 		self.beatfreq[:] = frame.beatfreq
+		self.rev_snapshot += 1
+
+	def ingest(self, raw_data: Union[bytes, np.ndarray, List[float], None]) -> bool:
+		"""
+		Per-frame hot path: store a raw frame and append it to the time series.
+
+		Equivalent to substitute_raw(raw_data) followed by update_t(), in one
+		call; invalid frames leave the dataset untouched.
+
+		Parameters
+		----------
+		raw_data : bytes-like, numpy.ndarray, list of float or None
+			Raw frame, as accepted by parse_frame.
+
+		Returns
+		-------
+		bool
+			True if the frame was valid and ingested.
+		"""
+		if not self.parse_into(raw_data):
+			return False
+		self.update_t()
+		return True
 
 	def update_t(self):
 		"""
-		Append current snapshot to time-series.
+		Append current snapshot to time-series, dropping the oldest sample.
+
+		O(1): overwrites the oldest ring-buffer slot (and its mirror) and
+		advances the head; t and the <name>_t arrays are rebound to new views.
 		"""
-		self.t = update_data_t(self.t, self.t[-1] + 1)
-		self.pir_t = update_data_t2(self.pir_t, self.pir)
-		self.q_t = update_data_t2(self.q_t, self.q)
-		self.i_t = update_data_t2(self.i_t, self.i)
-		self.piezo_t = update_data_t2(self.piezo_t, self.piezo)
-		self.temp_t = update_data_t2(self.temp_t, self.temp)
-		self.freqerr_t = update_data_t2(self.freqerr_t, self.freqerr)
-		self.beatfreq_t = update_data_t2(self.beatfreq_t, self.beatfreq)
+		h = self._head
+		n = self._n
+		t_new = self._t_buf[h + n - 1] + 1
+		self._t_buf[h] = t_new
+		self._t_buf[h + n] = t_new
+		self._ts_block[:, :, h] = self._tail_block
+		self._ts_block[:, :, h + n] = self._tail_block
+		self._head = (h + 1) % n
+		self._bind_series()
+		self.rev_t += 1
 
 
@@ -45,6 +45,7 @@ FourierMax = 62.5e6 # maximum Fourier frequency displayed on GUI
 ABS_CAL_FACTOR = 125e-3/1133 # calibration factor for magnitude of spectrums (would depend on individuals)
 LOCK_THRESHOLD_FREQ = 5e5 # threshold for the laser lock auto-disengage based on frequency error [Hz]
 TIME_PNTS = 1024          # number of points of plot in time
+USE_OPENGL = False        # opt-in: render plots through pyqtgraph's experimental OpenGL viewport (needs PyOpenGL)
 # --- parameters -----------------------
 FREQ_REF_STEP_0 = 500000 # step size of the reference frequency for PLL1
 FREQ_REF_STEP_1 = 500000 # step size of the reference frequency for PLL2
\ No newline at end of file
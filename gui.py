@@ -36,6 +36,7 @@ foreign countries or providing access to foreign persons.
 """
 
 import numpy as np
+import math
 import time
 import sys
 import os
@@ -47,10 +48,39 @@ import datetime
 
 import global_params as glp
 
+try:
+	import OpenGL  # noqa: F401  (PyOpenGL backs pyqtgraph's OpenGL viewport)
+	_HAVE_OPENGL = True
+except ImportError:
+	_HAVE_OPENGL = False
+
+# Opt-in (glp.USE_OPENGL): rasterize curves through pyqtgraph's experimental
+# OpenGL viewport. PlotWidgets created after this pick it up from the config.
+if glp.USE_OPENGL and _HAVE_OPENGL:
+	pg.setConfigOptions(useOpenGL=True, enableExperimental=True)
+
+
+def _data_curve(plot, pen):
+	"""Add a data curve drawn only over the visible x-range, peak-downsampled to the viewport width."""
+	curve = plot.plot(pen=pen)
+	# Set explicitly: PlotDataItem keyword arguments do not apply these options.
+	curve.setClipToView(True)
+	curve.setDownsampling(auto=True, method='peak')
+	return curve
+
 
 class _AxisSeparateScrollViewBox(pg.ViewBox):
 	"""ViewBox where vertical scroll changes only y-axis, horizontal scroll only x-axis."""
 
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		# Inverse child-group transform for wheel zoom centers; dropped on view changes.
+		self._inv_child_tr = None
+		self.sigTransformChanged.connect(self._invalidate_inv_child_tr)
+
+	def _invalidate_inv_child_tr(self, *args):
+		self._inv_child_tr = None
+
 	def wheelEvent(self, ev, axis=None):
 		# QGraphicsSceneWheelEvent has delta() and orientation(), not angleDelta()
 		delta_val = ev.delta() if hasattr(ev, 'delta') else 0
@@ -74,7 +104,10 @@ class _AxisSeparateScrollViewBox(pg.ViewBox):
 		delta = delta_val
 		s = 1.02 ** (delta * self.state['wheelScaleFactor'])
 		s = [(None if m is False else s) for m in mask]
-		center = fn.invertQTransform(self.childGroup.transform()).map(ev.pos())
+		inv = self._inv_child_tr
+		if inv is None:
+			inv = self._inv_child_tr = fn.invertQTransform(self.childGroup.transform())
+		center = inv.map(ev.pos())
 		center = pg.Point(center)
 
 		self._resetTarget()
@@ -83,7 +116,10 @@ class _AxisSeparateScrollViewBox(pg.ViewBox):
 		self.sigRangeChangedManually.emit(mask)
 
 
-class GuiLayout():
+class GuiLayout(QtCore.QObject):
+	# (background, foreground) per plot theme.
+	_THEME_COLORS = {"dark": ("k", "w"), "light": ("w", "k")}
+
 	def __init__(self):
 		"""
 		Create plot widgets for spectrum, I/Q, freq error, and ctrl signals.
@@ -91,12 +127,27 @@ class GuiLayout():
 		Spectrum Analyzer pan/zoom is clamped to [0, 125e6] Hz and y >= 100 uVpp.
 		No parameters; initializes all plot widgets and curves.
 		"""
+		# QObject so scene clicks can share one slot that resolves sender().
+		super().__init__()
 		# === plots =================================================
 		# Track plot widgets and per-plot state for menu actions.
 		self._plot_widgets = {}
+		self._scene_to_key = {}
 		self._plot_channel_items = {}
 		self._plot_autoscale_y = {}
 		self._active_plot_key = None
+		# Applied plot theme and its axis pen, built once per theme.
+		self._plot_theme = None
+		self._theme_pens = {}
+		# Last view-model revision drawn per plot key (see _needs_redraw).
+		self._drawn_rev = {}
+		self._drawn_freq_plot = None
+		# Latest-only hand-off from the acquisition tick (see request_update).
+		self._pending_vm = None
+		self._render_timer = QtCore.QTimer()
+		self._render_timer.setSingleShot(True)
+		self._render_timer.setInterval(0)
+		self._render_timer.timeout.connect(self._flush_pending_update)
 		# --- widget: spectrum -----------------------------
 		# Spectrum Analyzer QoL: clamp pan/zoom to sane limits.
 		# - x-axis: never < 0 Hz and never > 125e6 Hz
@@ -106,6 +157,8 @@ class GuiLayout():
 		self._sa_y_min_hard_vpp = 0.0
 		self._sa_y_min_range_vpp = 100e-6
 		self._sa_is_clamping = False
+		# Frequency-axis cache for peak-marker lookups: (axis object, f0, df or None)
+		self._sa_f_axis = (None, 0.0, None)
 
 		_vb = _AxisSeparateScrollViewBox()
 		self.pltSA = pg.PlotWidget(viewBox=_vb)
@@ -122,9 +175,14 @@ class GuiLayout():
 			minYRange=self._sa_y_min_range_vpp,
 		)
 		# Also pin y_min to 0 (prevents zooming/panning to y_min > 0).
+		# Range changes are coalesced: one clamp pass per event-loop turn.
+		self._sa_clamp_timer = QtCore.QTimer()
+		self._sa_clamp_timer.setSingleShot(True)
+		self._sa_clamp_timer.setInterval(0)
+		self._sa_clamp_timer.timeout.connect(self._clamp_sa_range)
 		self._sa_vb.sigRangeChanged.connect(self._on_sa_range_changed)
-		self.curveSA1=self.pltSA.plot(pen='g')
-		self.curveSA2=self.pltSA.plot(pen='c')
+		self.curveSA1=_data_curve(self.pltSA, 'g')
+		self.curveSA2=_data_curve(self.pltSA, 'c')
 		# PIR vertical lines: channel 0 green, channel 1 cyan (match curve colors)
 		self.pirSA1=self.pltSA.plot(pen='g')
 		self.pirSA2=self.pltSA.plot(pen='c')
@@ -133,6 +191,14 @@ class GuiLayout():
 		self.peakSA2 = pg.ScatterPlotItem(symbol='x', size=14, pen=pg.mkPen('c'), brush=pg.mkBrush('c'))
 		self.pltSA.addItem(self.peakSA1)
 		self.pltSA.addItem(self.peakSA2)
+		# Per-channel PIR line / peak marker coordinates, reused every tick and
+		# compared against the new values so unchanged overlays skip setData
+		# (NaN x forces the first PIR draw; None marks a marker never drawn).
+		self._pir_x = (np.full(2, np.nan), np.full(2, np.nan))
+		self._pir_y = (np.zeros(2), np.zeros(2))
+		self._peak_pos = (np.zeros((1, 2)), np.zeros((1, 2)))
+		self._peak_drawn = [None, None]
+		self._no_peak = np.empty((0, 2))
 		self._register_plot_widget("spectrum", self.pltSA)
 		self._plot_channel_items["spectrum"] = {
 			0: [self.curveSA1, self.pirSA1, self.peakSA1],
@@ -143,8 +209,8 @@ class GuiLayout():
 		self.pltI.setTitle("I value")
 		self.pltI.setLabel('left',text="I value", units='')
 		self.pltI.setLabel('bottom',text="Sample number", units='')
-		self.curveI1=self.pltI.plot(pen='g')
-		self.curveI2=self.pltI.plot(pen='c')
+		self.curveI1=_data_curve(self.pltI, 'g')
+		self.curveI2=_data_curve(self.pltI, 'c')
 		self._register_plot_widget("i_value", self.pltI)
 		self._plot_channel_items["i_value"] = {
 			0: [self.curveI1],
@@ -155,8 +221,8 @@ class GuiLayout():
 		self.pltQ.setTitle("Q value")
 		self.pltQ.setLabel('left',text="Q value", units='rad')
 		self.pltQ.setLabel('bottom',text="Sample number", units='')
-		self.curveQ1=self.pltQ.plot(pen='g')
-		self.curveQ2=self.pltQ.plot(pen='c')
+		self.curveQ1=_data_curve(self.pltQ, 'g')
+		self.curveQ2=_data_curve(self.pltQ, 'c')
 		self._register_plot_widget("q_value", self.pltQ)
 		self._plot_channel_items["q_value"] = {
 			0: [self.curveQ1],
@@ -167,8 +233,8 @@ class GuiLayout():
 		self.pltFREQERR.setTitle("Frequency error (Hz)")
 		self.pltFREQERR.setLabel('left',text="Frequency", units='Hz')
 		self.pltFREQERR.setLabel('bottom',text="Sample number", units='')
-		self.curveFREQERR1=self.pltFREQERR.plot(pen='g')
-		self.curveFREQERR2=self.pltFREQERR.plot(pen='c')
+		self.curveFREQERR1=_data_curve(self.pltFREQERR, 'g')
+		self.curveFREQERR2=_data_curve(self.pltFREQERR, 'c')
 		self._register_plot_widget("frequency", self.pltFREQERR)
 		self._plot_channel_items["frequency"] = {
 			0: [self.curveFREQERR1],
@@ -180,15 +246,38 @@ class GuiLayout():
 		self.pltCTRL.setTitle("Ctrl signals")
 		self.pltCTRL.setLabel('left',text="Ctrl signals", units='V')
 		self.pltCTRL.setLabel('bottom',text="Sample number", units='')
-		self.curveCTRL00=self.pltCTRL.plot(pen='g')
-		self.curveCTRL01=self.pltCTRL.plot(pen='r')
-		self.curveCTRL10=self.pltCTRL.plot(pen='c')
-		self.curveCTRL11=self.pltCTRL.plot(pen='m')
+		self.curveCTRL00=_data_curve(self.pltCTRL, 'g')
+		self.curveCTRL01=_data_curve(self.pltCTRL, 'r')
+		self.curveCTRL10=_data_curve(self.pltCTRL, 'c')
+		self.curveCTRL11=_data_curve(self.pltCTRL, 'm')
 		self._register_plot_widget("ctrl", self.pltCTRL)
 		self._plot_channel_items["ctrl"] = {
 			0: [self.curveCTRL00, self.curveCTRL01],
 			1: [self.curveCTRL10, self.curveCTRL11],
 		}
+		# Per-channel item lists for visibility and color changes, classified
+		# once: ch -> all items, and ch -> (curves, scatters) outside the Ctrl plot.
+		self._channel_items = {}
+		self._channel_color_items = {}
+		for plot_key, items_by_ch in self._plot_channel_items.items():
+			for ch, items in items_by_ch.items():
+				self._channel_items.setdefault(ch, []).extend(items)
+				# Keep Ctrl plot colors (different signals) distinct.
+				if plot_key == "ctrl":
+					continue
+				curves, scatters = self._channel_color_items.setdefault(ch, ([], []))
+				for item in items:
+					if isinstance(item, pg.ScatterPlotItem):
+						scatters.append(item)
+					else:
+						curves.append(item)
+		# All plots are registered: freeze widgets, plot items and axes for the
+		# whole-window passes (theme, axis reset).
+		self._plot_widget_list = tuple(self._plot_widgets.values())
+		self._plot_items = tuple(w.getPlotItem() for w in self._plot_widget_list)
+		self._plot_axes = tuple(
+			ax for w in self._plot_widget_list for ax in (w.getAxis("bottom"), w.getAxis("left"))
+		)
 		if self._active_plot_key is None:
 			self._active_plot_key = "spectrum"
 
@@ -197,12 +286,18 @@ class GuiLayout():
 		self._plot_widgets[key] = widget
 		self._plot_autoscale_y.setdefault(key, False)
 		try:
-			widget.scene().sigMouseClicked.connect(
-				lambda _evt, plot_key=key: self._set_active_plot(plot_key)
-			)
+			scene = widget.scene()
+			self._scene_to_key[scene] = key
+			scene.sigMouseClicked.connect(self._on_scene_clicked)
 		except Exception:
 			pass
 
+	def _on_scene_clicked(self, _evt) -> None:
+		"""Shared sigMouseClicked slot: activate the plot whose scene was clicked."""
+		key = self._scene_to_key.get(self.sender())
+		if key is not None:
+			self._set_active_plot(key)
+
 	def _set_active_plot(self, key: str) -> None:
 		"""Set the active plot key (used for autoscale and export)."""
 		if key in self._plot_widgets:
@@ -254,76 +349,66 @@ class GuiLayout():
 
 	def set_channel_visible(self, channel: int, visible: bool) -> None:
 		"""Show/hide the given channel across all plots."""
-		ch = int(channel)
-		for _plot_key, items_by_ch in self._plot_channel_items.items():
-			items = items_by_ch.get(ch)
-			if not items:
-				continue
-			for item in items:
-				try:
-					item.setVisible(bool(visible))
-				except Exception:
-					pass
+		visible = bool(visible)
+		for item in self._channel_items.get(int(channel), ()):
+			item.setVisible(visible)
 
 	def set_channel_color(self, channel: int, color) -> None:
 		"""Set the trace color for the given channel across all plots."""
-		ch = int(channel)
+		items = self._channel_color_items.get(int(channel))
+		if items is None:
+			return
+		curves, scatters = items
 		pen = pg.mkPen(color)
-		brush = pg.mkBrush(color)
-		for plot_key, items_by_ch in self._plot_channel_items.items():
-			# Keep Ctrl plot colors (different signals) distinct.
-			if plot_key == "ctrl":
-				continue
-			items = items_by_ch.get(ch)
-			if not items:
-				continue
-			for item in items:
-				try:
-					# PlotDataItem / Curve
-					if hasattr(item, "setPen"):
-						item.setPen(pen)
-					# ScatterPlotItem
-					if hasattr(item, "setBrush"):
-						item.setBrush(brush)
-				except Exception:
-					pass
+		for item in curves:
+			item.setPen(pen)
+		if scatters:
+			brush = pg.mkBrush(color)
+			for item in scatters:
+				item.setPen(pen)
+				item.setBrush(brush)
 
 	def apply_plot_theme(self, theme: str) -> None:
 		"""
 		Apply a plot theme:
 		- 'dark': black background, white axes
 		- 'light': white background, black axes
+
+		No-op when the theme is already applied.
 		"""
 		theme = (theme or "dark").lower()
-		if theme not in ("dark", "light"):
+		if theme not in self._THEME_COLORS:
 			theme = "dark"
-		bg = "k" if theme == "dark" else "w"
-		fg = "w" if theme == "dark" else "k"
-		pen = pg.mkPen(fg)
+		if theme == self._plot_theme:
+			return
+		self._plot_theme = theme
+		bg, fg = self._THEME_COLORS[theme]
+		pen = self._theme_pens.get(theme)
+		if pen is None:
+			pen = self._theme_pens[theme] = pg.mkPen(fg)
 
-		for _key, plot in self._plot_widgets.items():
+		for plot in self._plot_widget_list:
 			try:
 				plot.setBackground(bg)
 			except Exception:
 				pass
-			# Title color (important for light theme).
+		# Title color (important for light theme).
+		for pi in self._plot_items:
 			try:
-				pi = plot.getPlotItem()
 				title_html = getattr(pi.titleLabel, "text", None)
 				if title_html:
 					pi.titleLabel.setText(title_html, color=fg)
 			except Exception:
 				pass
-			for ax_name in ("bottom", "left"):
-				try:
-					ax = plot.getAxis(ax_name)
-					ax.setPen(pen)
-					if hasattr(ax, "setTextPen"):
-						ax.setTextPen(pen)
-					if hasattr(ax, "setTickPen"):
-						ax.setTickPen(pen)
-				except Exception:
-					pass
+		for ax in self._plot_axes:
+			try:
+				ax.setPen(pen)
+				if hasattr(ax, "setTextPen"):
+					ax.setTextPen(pen)
+				if hasattr(ax, "setTickPen"):
+					ax.setTickPen(pen)
+			except Exception:
+				pass
 
 	def reset_all_axes(self) -> None:
 		"""
@@ -332,9 +417,9 @@ class GuiLayout():
 		This matches the behavior of clicking the built-in "A" (auto) button in each plot,
 		so plots resume normal scrolling/auto-range behavior after manual pan/zoom.
 		"""
-		for _key, plot in self._plot_widgets.items():
+		for pi in self._plot_items:
 			try:
-				plot.getPlotItem().autoBtnClicked()
+				pi.autoBtnClicked()
 			except Exception:
 				pass
 
@@ -346,13 +431,48 @@ class GuiLayout():
 		----------
 		vm : PlotViewModel
 			View model with f, spectrum, t, i_t, q_t, etc.
+
+		Only plots with new data call setData; the scene batches the resulting
+		repaints into one paint per plot on this event-loop turn. Supersedes
+		any view model still pending from request_update.
 		"""
+		self._pending_vm = None
+		self._render_timer.stop()
 		self.updateGUIpltSA(vm)
 		self.updateGUIpltI(vm)
 		self.updateGUIpltQ(vm)
 		self.updateGUIpltFREQERR(vm)
 		self.updateGUIpltCTRL(vm)
 
+	def request_update(self, vm) -> None:
+		"""
+		Queue a PlotViewModel to be drawn on the next event-loop turn.
+
+		Latest-only: a view model still pending is replaced, so frames that
+		arrive faster than the GUI paints are drawn once, from the newest.
+
+		Parameters
+		----------
+		vm : PlotViewModel
+			View model to draw.
+		"""
+		self._pending_vm = vm
+		if not self._render_timer.isActive():
+			self._render_timer.start()
+
+	def _flush_pending_update(self) -> None:
+		"""Draw the view model left by request_update, if any."""
+		vm = self._pending_vm
+		if vm is not None:
+			self.updateGUIs(vm)
+
+	def _needs_redraw(self, key: str, rev) -> bool:
+		"""Return False if plot key already shows revision rev (None: always redraw)."""
+		if rev is not None and self._drawn_rev.get(key) == rev:
+			return False
+		self._drawn_rev[key] = rev
+		return True
+
 	def updateGUIpltSA(self, vm):
 		"""
 		Update spectrum plot, PIR vertical lines, and FFT peak markers from view model.
@@ -360,68 +480,156 @@ class GuiLayout():
 		PIR lines: vertical at PIR frequency (Hz), colors match channel 0 (green) / channel 1 (cyan).
 		Peak markers: (freq_peak, amp_peak) from FFT; channel 0 "+", channel 1 "x".
 		When beatfreq is 0 but spectrum has a peak, use client-side argmax fallback.
+		Skipped when the view model carries an already drawn rev_spectrum.
 		"""
-		self.curveSA1.setData(vm.f, vm.spectrum[0])
-		self.curveSA2.setData(vm.f, vm.spectrum[1])
-		# PIR vertical lines (PIR in Hz)
-		pir0x = [vm.pir[0], vm.pir[0]]
-		pir0y = [0.0, max(vm.spectrum[0]) if len(vm.spectrum[0]) > 0 else 0.0]
-		self.pirSA1.setData(pir0x, pir0y)
-		pir1x = [vm.pir[1], vm.pir[1]]
-		pir1y = [0.0, max(vm.spectrum[1]) if len(vm.spectrum[1]) > 0 else 0.0]
-		self.pirSA2.setData(pir1x, pir1y)
+		if not self._needs_redraw("spectrum", vm.rev_spectrum):
+			return
 		# FFT peak markers: vm.beatfreq already has effective values (from process_tick)
 		peak0 = vm.beatfreq[0]
 		peak1 = vm.beatfreq[1]
+		spec_max0, spec_max1, amp0, amp1 = self._compute_sa_aux(vm, peak0, peak1)
+		self.curveSA1.setData(vm.f, vm.spectrum[0])
+		self.curveSA2.setData(vm.f, vm.spectrum[1])
+		# PIR vertical lines (PIR in Hz); overlays are only re-set when they move.
+		pir_x, pir_y = self._pir_x, self._pir_y
+		for ch, item, pir, top in (
+			(0, self.pirSA1, vm.pir[0], spec_max0),
+			(1, self.pirSA2, vm.pir[1], spec_max1),
+		):
+			if pir_x[ch][0] != pir or pir_y[ch][1] != top:
+				pir_x[ch][:] = pir
+				pir_y[ch][1] = top
+				item.setData(pir_x[ch], pir_y[ch])
+		# Hide markers when no valid peak (avoids (0,0) display after reconnect).
+		# Emptying the data (not setVisible) keeps channel visibility independent.
+		drawn = self._peak_drawn
+		for ch, item, peak, amp in (
+			(0, self.peakSA1, peak0, amp0),
+			(1, self.peakSA2, peak1, amp1),
+		):
+			state = (peak, amp) if peak > 0 else ()
+			if state == drawn[ch]:
+				continue
+			drawn[ch] = state
+			if state:
+				pos = self._peak_pos[ch]
+				pos[0] = state
+				item.setData(pos=pos)
+			else:
+				item.setData(pos=self._no_peak)
+
+	def _compute_sa_aux(self, vm, peak0, peak1):
+		"""
+		Compute the NumPy-side values for the spectrum overlays in one block.
 
-		def amp_at_freq(f_arr, spec, freq):
-			if len(spec) == 0 or len(f_arr) == 0:
-				return 0.0
-			idx = int(np.clip(np.argmin(np.abs(f_arr - freq)), 0, len(spec) - 1))
-			return float(spec[idx])
+		Returns (spec_max0, spec_max1, amp0, amp1): per-channel spectrum maxima
+		(PIR line heights) and the amplitudes at the peak frequencies, so the
+		reductions run back to back before any Qt item is touched.
 
-		amp0 = amp_at_freq(vm.f, vm.spectrum[0], peak0)
-		amp1 = amp_at_freq(vm.f, vm.spectrum[1], peak1)
-		# Hide markers when no valid peak (avoids (0,0) display after reconnect)
-		self.peakSA1.setData(pos=np.array([[peak0, amp0]]) if peak0 > 0 else np.empty((0, 2)))
-		self.peakSA2.setData(pos=np.array([[peak1, amp1]]) if peak1 > 0 else np.empty((0, 2)))
+		One argmax pass per channel gives both the maximum and its bin; a peak
+		on that bin (the client-side fallback case) reuses the maximum as its
+		amplitude instead of looking it up again.
+		"""
+		spectrum, f = vm.spectrum, vm.f
+		if spectrum[0].size == 0 or spectrum[1].size == 0:
+			spec_max0 = spectrum[0].max() if spectrum[0].size > 0 else 0.0
+			spec_max1 = spectrum[1].max() if spectrum[1].size > 0 else 0.0
+			amp0 = self._amp_at_freq(f, spectrum[0], peak0)
+			amp1 = self._amp_at_freq(f, spectrum[1], peak1)
+			return spec_max0, spec_max1, amp0, amp1
+		idx0, idx1 = np.argmax(spectrum, axis=1)
+		spec_max0 = spectrum[0][idx0]
+		spec_max1 = spectrum[1][idx1]
+		n = len(f)
+		if idx0 < n and f[idx0] == peak0:
+			amp0 = float(spec_max0)
+		else:
+			amp0 = self._amp_at_freq(f, spectrum[0], peak0)
+		if idx1 < n and f[idx1] == peak1:
+			amp1 = float(spec_max1)
+		else:
+			amp1 = self._amp_at_freq(f, spectrum[1], peak1)
+		return spec_max0, spec_max1, amp0, amp1
+
+	def _amp_at_freq(self, f_arr, spec, freq) -> float:
+		"""
+		Return the spectrum amplitude at the bin nearest to freq (Hz).
+
+		f_arr is sorted; for the usual uniform FFT axis the bin is computed
+		directly from (f0, df), cached per axis object, otherwise it is found
+		by bisection. Ties go to the lower bin and non-finite freq maps to bin 0.
+		"""
+		n = len(f_arr)
+		if len(spec) == 0 or n == 0:
+			return 0.0
+		axis, f0, df = self._sa_f_axis
+		if axis is not f_arr:
+			f0 = float(f_arr[0])
+			df = None
+			if n > 1:
+				steps = np.diff(f_arr)
+				if np.allclose(steps, steps[0]) and steps[0] > 0:
+					df = float(steps[0])
+			self._sa_f_axis = (f_arr, f0, df)
+		if not math.isfinite(freq):
+			idx = 0
+		elif df is not None:
+			idx = min(max(math.ceil((freq - f0) / df - 0.5), 0), n - 1)
+		else:
+			idx = min(int(np.searchsorted(f_arr, freq)), n - 1)
+			if idx > 0 and abs(f_arr[idx - 1] - freq) <= abs(f_arr[idx] - freq):
+				idx -= 1
+		return float(spec[min(idx, len(spec) - 1)])
 
 	def _on_sa_range_changed(self, *args):
 		"""
-		Clamp Spectrum Analyzer view: x in [0, 125e6] Hz, y_min=0, y_range >= 100 uVpp.
+		Schedule a Spectrum Analyzer clamp pass (see _clamp_sa_range).
+
+		Intermediate pan/zoom steps within one event-loop turn collapse into a
+		single pass run by a zero-interval single-shot timer.
 
 		Parameters
 		----------
 		*args
 			Ignored (slot signature from sigRangeChanged).
 		"""
-		if self._sa_is_clamping:
+		if self._sa_is_clamping or self._sa_clamp_timer.isActive():
 			return
+		self._sa_clamp_timer.start()
+
+	def _clamp_sa_range(self):
+		"""Clamp Spectrum Analyzer view: x in [0, 125e6] Hz, y_min=0, y_range >= 100 uVpp."""
 		self._sa_is_clamping = True
 		try:
 			vb = self._sa_vb
-			(x0, x1), (y0, y1) = vb.viewRange()
+			xmin, xmax = self._sa_x_min_hz, self._sa_x_max_hz
+			(cx0, cx1), (cy0, cy1) = vb.viewRange()
+			x0, x1 = cx0, cx1
 
 			# Clamp x to [0, 125e6].
 			dx = x1 - x0
 			if dx <= 0:
 				dx = 1.0
-			if x0 < self._sa_x_min_hz:
-				x0 = self._sa_x_min_hz
+			if x0 < xmin:
+				x0 = xmin
 				x1 = x0 + dx
-			if x1 > self._sa_x_max_hz:
-				x1 = self._sa_x_max_hz
+			if x1 > xmax:
+				x1 = xmax
 				x0 = x1 - dx
-			if x0 < self._sa_x_min_hz:
-				x0 = self._sa_x_min_hz
+			x0 = max(x0, xmin)
 
 			# Pin y_min to 0 and enforce y-range >= 100 uVpp.
-			dy = y1 - y0
-			if dy < self._sa_y_min_range_vpp:
-				dy = self._sa_y_min_range_vpp
 			y0 = 0.0
-			y1 = y0 + dy
-
+			y1 = max(cy1 - cy0, self._sa_y_min_range_vpp)
+
+			# Already within limits (up to rounding): no setRange feedback round.
+			tol_x = 1e-9 * dx
+			tol_y = 1e-9 * y1
+			if (
+				abs(x0 - cx0) <= tol_x and abs(x1 - cx1) <= tol_x
+				and abs(cy0) <= tol_y and abs(y1 - cy1) <= tol_y
+			):
+				return
 			vb.setRange(xRange=(x0, x1), yRange=(y0, y1), padding=0)
 		finally:
 			self._sa_is_clamping = False
@@ -435,6 +643,8 @@ class GuiLayout():
 		vm : PlotViewModel
 			View model with t and i_t.
 		"""
+		if not self._needs_redraw("i_value", vm.rev_t):
+			return
 		self.curveI1.setData(vm.t, vm.i_t[0])
 		self.curveI2.setData(vm.t, vm.i_t[1])
 
@@ -447,6 +657,8 @@ class GuiLayout():
 		vm : PlotViewModel
 			View model with t and q_t.
 		"""
+		if not self._needs_redraw("q_value", vm.rev_t):
+			return
 		self.curveQ1.setData(vm.t, vm.q_t[0])
 		self.curveQ2.setData(vm.t, vm.q_t[1])
 
@@ -459,6 +671,13 @@ class GuiLayout():
 		vm : PlotViewModel
 			View model with t and freq_plot_t.
 		"""
+		# freq_plot_t also depends on the reference setpoints, so at the same
+		# rev_t it is compared with the (owned, never rewritten) array last drawn.
+		if not self._needs_redraw("frequency", vm.rev_t) and np.array_equal(
+			vm.freq_plot_t, self._drawn_freq_plot
+		):
+			return
+		self._drawn_freq_plot = vm.freq_plot_t
 		self.curveFREQERR1.setData(vm.t, vm.freq_plot_t[0])
 		self.curveFREQERR2.setData(vm.t, vm.freq_plot_t[1])
 
@@ -471,6 +690,8 @@ class GuiLayout():
 		vm : PlotViewModel
 			View model with t, piezo_t, and temp_t.
 		"""
+		if not self._needs_redraw("ctrl", vm.rev_t):
+			return
 		self.curveCTRL00.setData(vm.t, vm.piezo_t[0])
 		self.curveCTRL01.setData(vm.t, vm.temp_t[0])
 		self.curveCTRL10.setData(vm.t, vm.piezo_t[1])
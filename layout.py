@@ -35,9 +35,12 @@ export authority as may be required before exporting such information to
 foreign countries or providing access to foreign persons.
 """
 
+import contextlib
+import functools
+import math
 import time
-from collections import deque
 
+import numpy as np
 import pyqtgraph as pg
 from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 
@@ -45,10 +48,20 @@ import global_params as glp
 import data_models as aux
 import widgets as st
 import gui
-import frame_schema
 import rp_protocol
 
 
+@functools.lru_cache(maxsize=None)
+def _color_icon(key: str) -> QtGui.QIcon:
+    """Return a colored square icon for a pyqtgraph color key (shared by all combos)."""
+    try:
+        pix = QtGui.QPixmap(12, 12)
+        pix.fill(pg.mkColor(key))
+        return QtGui.QIcon(pix)
+    except Exception:
+        return QtGui.QIcon()
+
+
 def _make_group_box_font() -> QtGui.QFont:
     """Return a font matching standard label size without bold."""
     base_font = QtWidgets.QLabel().font()
@@ -56,6 +69,22 @@ def _make_group_box_font() -> QtGui.QFont:
     return base_font
 
 
+_group_box_font_installed = False
+
+
+def _install_group_box_font() -> None:
+    """
+    Make the label font the application default for QGroupBox (once).
+
+    Replaces per-box setFont calls: the class font applies to every group
+    box, including ones built later (e.g. the lazy laser-lock panel).
+    """
+    global _group_box_font_installed
+    if not _group_box_font_installed:
+        QtWidgets.QApplication.setFont(_make_group_box_font(), "QGroupBox")
+        _group_box_font_installed = True
+
+
 class Session:
     """
     Holds connection, dataset, widgets, and plot state; runs the processing loop.
@@ -74,16 +103,34 @@ class Session:
         self.connection = None
         self.dataset = aux.DataPackage()
         self.widgets = st.WidgetList(None)
+        # Reference-frequency inputs for the laser-lock frequency plot, read into
+        # a reused buffer each tick.
+        self._ref_freq_boxes = (
+            self.widgets.freq_ref_loop_0.box, self.widgets.freq_ref_loop_1.box,
+        )
+        self._ref_freqs = np.zeros(2)
         self.gui = gui.GuiLayout()
         self.frame_count = 0
         self.parse_error_count = 0
         self.fps = 0.0
+        # FPS: exponentially weighted frame count / elapsed time, time constant 2 s.
         self._fps_window_s = 2.0
-        self._frame_times = deque()
+        self._fps_frames = 0.0
+        self._fps_time = 0.0
+        self._last_frame_t = None
+        # False while nothing displays fps (see set_fps_needed).
+        self._fps_needed = True
         self._warnings_widget = None
+        self._append_warning = None
         self._warned_fallback_ch0 = False
         self._warned_fallback_ch1 = False
         self.render_paused = False
+        # False when the user has hidden every plot panel (set by MainLayout).
+        self.any_plot_visible = True
+        # Upper bound on frames drained per tick, so a flood cannot starve the GUI.
+        self.max_frames_per_tick = 64
+        # Plot mode from the connection's server variant (see refresh_server_variant).
+        self._is_phasemeter = False
 
     def is_connected(self) -> bool:
         """
@@ -108,6 +155,7 @@ class Session:
             self.connection.disconnect()
             self.connection = None
         self.widgets.set_socket(None)
+        self._is_phasemeter = False
         self.dataset.clear()
 
     def set_connection(self, connection) -> None:
@@ -121,11 +169,55 @@ class Session:
         """
         self.connection = connection
         self.widgets.set_socket(connection.socket if connection else None)
+        self.refresh_server_variant()
         if connection is not None:
             self._warned_fallback_ch0 = False
             self._warned_fallback_ch1 = False
+            self._fps_frames = 0.0
+            self._fps_time = 0.0
+            self._last_frame_t = None
             connection.set_log_callback(self.log_warning)
 
+    def set_fps_needed(self, needed: bool) -> None:
+        """
+        Enable or skip the per-frame fps update.
+
+        Parameters
+        ----------
+        needed : bool
+            False while no widget displays fps (e.g. window hidden or
+            minimized); the estimate restarts when set back to True.
+        """
+        self._fps_needed = needed
+        if not needed:
+            self._fps_frames = 0.0
+            self._fps_time = 0.0
+            self._last_frame_t = None
+
+    def refresh_server_variant(self) -> None:
+        """
+        Re-read the server variant that selects the frequency plot mode.
+
+        Called on connection changes; call again after overriding the
+        variant on the live connection.
+        """
+        self._is_phasemeter = (
+            self.connection is not None
+            and self.connection.server_variant == rp_protocol.RP_CAP_PHASEMETER
+        )
+
+    def set_warnings_widget(self, widget) -> None:
+        """
+        Set the text box that receives log_warning messages.
+
+        Parameters
+        ----------
+        widget : QPlainTextEdit or None
+            Warnings box, or None to drop messages.
+        """
+        self._warnings_widget = widget
+        self._append_warning = widget.appendPlainText if widget is not None else None
+
     def log_warning(self, msg: str) -> None:
         """
         Append a warning or debug message to the warnings text box.
@@ -135,11 +227,10 @@ class Session:
         msg : str
             Message to append (with timestamp).
         """
-        if self._warnings_widget is None:
+        append = self._append_warning
+        if append is None:
             return
-        from datetime import datetime
-        ts = datetime.now().strftime("%H:%M:%S")
-        self._warnings_widget.appendPlainText(f"[{ts}] {msg}")
+        append(f"[{time.strftime('%H:%M:%S')}] {msg}")
 
     def build_plot_view_model(self) -> aux.PlotViewModel:
         """
@@ -148,61 +239,75 @@ class Session:
         Uses PIR readout for phasemeter mode, and PIR minus reference frequency
         for laser-lock mode.
         """
-        is_phasemeter = (
-            self.connection is not None
-            and self.connection.server_variant == rp_protocol.RP_CAP_PHASEMETER
-        )
-        ref_freqs = [
-            self.widgets.freq_ref_loop_0.box.value(),
-            self.widgets.freq_ref_loop_1.box.value(),
-        ]
-        freq_plot_t = aux.compute_freq_plot_t(self.dataset, is_phasemeter, ref_freqs)
+        ref_freqs = self._ref_freqs
+        box0, box1 = self._ref_freq_boxes
+        ref_freqs[0] = box0.value()
+        ref_freqs[1] = box1.value()
+        freq_plot_t = aux.compute_freq_plot_t(self.dataset, self._is_phasemeter, ref_freqs)
         return aux.build_plot_view_model(self.dataset, freq_plot_t=freq_plot_t)
 
     def process_tick(self) -> None:
         """
-        Read one frame, update dataset and plots, run widget processing.
+        Drain buffered frames, update dataset and plots, run widget processing.
 
-        No-op if disconnected. On parse error increments parse_error_count.
-        On closed/os_error disconnects. Updates frame_count and fps.
+        No-op if disconnected. Reads frames until none is buffered (at most
+        max_frames_per_tick); each one updates the dataset and runs widget
+        processing (data dump, auto PLL turn-off), while the plots are updated
+        once, from the newest frame. On parse error increments
+        parse_error_count. On closed/os_error disconnects. Updates frame_count
+        and fps. Plots are queued with gui.request_update and drawn
+        latest-only on the next event-loop turn.
 
         Returns
         -------
         None
         """
-        if self.connection is None:
-            return
-        data = self.connection.read_frame(timeout_s=0.0)
-        if data is None:
-            status = self.connection.last_read_status
-            if status == "parse_error":
-                self.parse_error_count += 1
-            elif status in ("closed", "os_error"):
-                self.disconnect()
-            return
-        if len(data) != frame_schema.FRAME_SIZE_DOUBLES:
-            self.parse_error_count += 1
+        conn = self.connection
+        if conn is None:
             return
+        read_frame = conn.read_frame
+        ingest = self._ingest_frame
+        processing = self.widgets.processing
+        dataset = self.dataset
+        got_frame = False
+        for _ in range(self.max_frames_per_tick):
+            data = read_frame(timeout_s=0.0)
+            if data is None:
+                status = conn.last_read_status
+                if status == "parse_error":
+                    self.parse_error_count += 1
+                elif status in ("closed", "os_error"):
+                    self.disconnect()
+                    return
+                break
+            # read_frame validates the frame (size included): parse errors come
+            # back as None with last_read_status "parse_error".
+            ingest(data)
+            processing(dataset)
+            got_frame = True
+        if got_frame and not self.render_paused and self.any_plot_visible:
+            self.gui.request_update(self.build_plot_view_model())
+
+    def _ingest_frame(self, data) -> None:
+        """Count one frame, update fps, and load it into the dataset with effective beatfreq."""
         self.frame_count += 1
-        now = time.monotonic()
-        self._frame_times.append(now)
-        cutoff = now - self._fps_window_s
-        while self._frame_times and self._frame_times[0] < cutoff:
-            self._frame_times.popleft()
-        if len(self._frame_times) >= 2:
-            span = self._frame_times[-1] - self._frame_times[0]
-            self.fps = (len(self._frame_times) - 1) / span if span > 0 else 0.0
-        else:
-            self.fps = 0.0
-        self.dataset.substitute_data(data)
-        self.dataset.update_t()
-        self.widgets.beatfreq = self.dataset.beatfreq
+        if self._fps_needed:
+            now = time.monotonic()
+            last = self._last_frame_t
+            self._last_frame_t = now
+            if last is not None:
+                dt = now - last
+                decay = math.exp(-dt / self._fps_window_s)
+                self._fps_frames = self._fps_frames * decay + 1.0
+                self._fps_time = self._fps_time * decay + dt
+                self.fps = self._fps_frames / self._fps_time if self._fps_time > 0.0 else 0.0
+        dataset = self.dataset
+        widgets = self.widgets
+        dataset.ingest(data)
+        beatfreq = dataset.beatfreq
         # Override with effective beatfreq when server sends 0 (Reacquire + display)
-        eff0, fallback0 = aux.effective_beatfreq(
-            self.dataset.spectrum[0], self.dataset.beatfreq[0], self.dataset.f
-        )
-        eff1, fallback1 = aux.effective_beatfreq(
-            self.dataset.spectrum[1], self.dataset.beatfreq[1], self.dataset.f
+        (eff0, eff1), (fallback0, fallback1) = aux.effective_beatfreq_batch(
+            dataset.spectrum, beatfreq, dataset.f
         )
         if fallback0 and not self._warned_fallback_ch0:
             self.log_warning("Ch1: client-side peak fallback (server beatfreq=0 or wrong)")
@@ -210,14 +315,10 @@ class Session:
         if fallback1 and not self._warned_fallback_ch1:
             self.log_warning("Ch2: client-side peak fallback (server beatfreq=0 or wrong)")
             self._warned_fallback_ch1 = True
-        self.dataset.beatfreq[0] = eff0
-        self.dataset.beatfreq[1] = eff1
-        self.widgets.beatfreq[0] = eff0
-        self.widgets.beatfreq[1] = eff1
-        plot_vm = self.build_plot_view_model()
-        if not self.render_paused:
-            self.gui.updateGUIs(plot_vm)
-        self.widgets.processing(self.dataset)
+        beatfreq[0] = eff0
+        beatfreq[1] = eff1
+        widgets.beatfreq[0] = eff0
+        widgets.beatfreq[1] = eff1
 
 
 class MainLayout():
@@ -232,7 +333,7 @@ class MainLayout():
         """
         self.session = session
 
-        group_box_font = _make_group_box_font()
+        _install_group_box_font()
 
         # --- New layout: single window, resizable splitter -------------
         # Left pane: all controls visible (readout + laser lock + data)
@@ -240,16 +341,15 @@ class MainLayout():
 
         # Left pane (controls)
         self.readout_setting = ReadoutSettingLayout(self.session.widgets)
-        self.ctrl_setting = LaserLockSettingLayout(self.session.widgets)
+        # Laser-lock controls are built on first use (see _ensure_laser_lock_built).
+        self.ctrl_setting = None
 
         readout_controls_widget = QtWidgets.QWidget()
         readout_controls_widget.setLayout(self.readout_setting)
         self.ctrl_controls_widget = QtWidgets.QWidget()
-        self.ctrl_controls_widget.setLayout(self.ctrl_setting)
 
         # Data Logger (moved to bottom of pane)
         self.data_logger_group = QtWidgets.QGroupBox("Data Logger")
-        self.data_logger_group.setFont(group_box_font)
         data_layout = QtWidgets.QVBoxLayout()
         data_layout.addWidget(self.session.widgets.data_logger_controls_widget)
         data_layout.addWidget(self.session.widgets.data_logger_record_length_fields_widget)
@@ -258,7 +358,6 @@ class MainLayout():
 
         # Plots configuration (above Data Logger)
         self.plots_group = QtWidgets.QGroupBox("Plots")
-        self.plots_group.setFont(group_box_font)
         plots_layout = QtWidgets.QGridLayout()
         plots_layout.setContentsMargins(8, 8, 8, 8)
         plots_layout.setHorizontalSpacing(10)
@@ -268,8 +367,8 @@ class MainLayout():
         self.plot_ch2_visible_cb = QtWidgets.QCheckBox("Ch2")
         self.plot_ch1_visible_cb.setChecked(True)
         self.plot_ch2_visible_cb.setChecked(True)
-        self.plot_ch1_visible_cb.toggled.connect(lambda checked: self.session.gui.set_channel_visible(0, checked))
-        self.plot_ch2_visible_cb.toggled.connect(lambda checked: self.session.gui.set_channel_visible(1, checked))
+        self.plot_ch1_visible_cb.toggled.connect(self._on_ch1_visible_toggled)
+        self.plot_ch2_visible_cb.toggled.connect(self._on_ch2_visible_toggled)
         plots_layout.addWidget(QtWidgets.QLabel("Show channels:"), 0, 0)
         plots_layout.addWidget(self.plot_ch1_visible_cb, 0, 1)
         plots_layout.addWidget(self.plot_ch2_visible_cb, 0, 2)
@@ -288,14 +387,7 @@ class MainLayout():
                 ("Black", "k"),
             ]:
                 # Add a colored square icon next to the label.
-                try:
-                    qcolor = pg.mkColor(key)
-                    pix = QtGui.QPixmap(12, 12)
-                    pix.fill(qcolor)
-                    icon = QtGui.QIcon(pix)
-                except Exception:
-                    icon = QtGui.QIcon()
-                combo.addItem(icon, label, key)
+                combo.addItem(_color_icon(key), label, key)
             for idx in range(combo.count()):
                 if combo.itemData(idx) == default_key:
                     combo.setCurrentIndex(idx)
@@ -304,12 +396,8 @@ class MainLayout():
 
         self.plot_ch1_color_combo = _make_color_combo("g")
         self.plot_ch2_color_combo = _make_color_combo("c")
-        self.plot_ch1_color_combo.currentIndexChanged.connect(
-            lambda _idx: self.session.gui.set_channel_color(0, self.plot_ch1_color_combo.currentData())
-        )
-        self.plot_ch2_color_combo.currentIndexChanged.connect(
-            lambda _idx: self.session.gui.set_channel_color(1, self.plot_ch2_color_combo.currentData())
-        )
+        self.plot_ch1_color_combo.currentIndexChanged.connect(self._on_ch1_color_changed)
+        self.plot_ch2_color_combo.currentIndexChanged.connect(self._on_ch2_color_changed)
         plots_layout.addWidget(QtWidgets.QLabel("Ch1 color:"), 1, 0)
         plots_layout.addWidget(self.plot_ch1_color_combo, 1, 1, 1, 2)
         plots_layout.addWidget(QtWidgets.QLabel("Ch2 color:"), 2, 0)
@@ -319,9 +407,7 @@ class MainLayout():
         self.plot_theme_combo.addItem("Dark", "dark")
         self.plot_theme_combo.addItem("Light", "light")
         self.plot_theme_combo.setCurrentIndex(0)
-        self.plot_theme_combo.currentIndexChanged.connect(
-            lambda _idx: self.session.gui.apply_plot_theme(self.plot_theme_combo.currentData())
-        )
+        self.plot_theme_combo.currentIndexChanged.connect(self._on_plot_theme_changed)
         self.reset_axes_btn = QtWidgets.QPushButton("Reset Axes")
         self.reset_axes_btn.clicked.connect(self.session.gui.reset_all_axes)
         plots_layout.addWidget(QtWidgets.QLabel("Background:"), 3, 0)
@@ -333,15 +419,16 @@ class MainLayout():
 
         # Warnings / debug log at bottom of left pane
         self.warnings_group = QtWidgets.QGroupBox("Warnings & Log")
-        self.warnings_group.setFont(group_box_font)
         self.warnings_edit = QtWidgets.QPlainTextEdit()
         self.warnings_edit.setReadOnly(True)
+        # Bounded scrollback: Qt drops the oldest lines beyond this many.
+        self.warnings_edit.setMaximumBlockCount(500)
         self.warnings_edit.setMaximumHeight(120)
         self.warnings_edit.setPlaceholderText("Warnings and debug info appear here.")
         warnings_layout = QtWidgets.QVBoxLayout()
         warnings_layout.addWidget(self.warnings_edit)
         self.warnings_group.setLayout(warnings_layout)
-        self.session._warnings_widget = self.warnings_edit
+        self.session.set_warnings_widget(self.warnings_edit)
 
         self.controls_widget = QtWidgets.QWidget()
         controls_vbox = QtWidgets.QVBoxLayout()
@@ -429,20 +516,33 @@ class MainLayout():
         # Apply default (disconnected) UI mode immediately on startup.
         self.apply_server_variant()
 
+    def _on_ch1_visible_toggled(self, checked: bool) -> None:
+        """Show/hide channel 1 traces (plot_ch1_visible_cb)."""
+        self.session.gui.set_channel_visible(0, checked)
+
+    def _on_ch2_visible_toggled(self, checked: bool) -> None:
+        """Show/hide channel 2 traces (plot_ch2_visible_cb)."""
+        self.session.gui.set_channel_visible(1, checked)
+
+    def _on_ch1_color_changed(self, _idx: int) -> None:
+        """Apply the color picked in plot_ch1_color_combo."""
+        self.session.gui.set_channel_color(0, self.plot_ch1_color_combo.currentData())
+
+    def _on_ch2_color_changed(self, _idx: int) -> None:
+        """Apply the color picked in plot_ch2_color_combo."""
+        self.session.gui.set_channel_color(1, self.plot_ch2_color_combo.currentData())
+
+    def _on_plot_theme_changed(self, _idx: int) -> None:
+        """Apply the theme picked in plot_theme_combo."""
+        self.session.gui.apply_plot_theme(self.plot_theme_combo.currentData())
+
     def _on_reacquire_press(self) -> None:
         """Sync beatfreq from dataset (with effective fallback), send reset hold (matches old client)."""
-        self.session.widgets.beatfreq = self.session.dataset.beatfreq.copy()
-        eff0, _ = aux.effective_beatfreq(
-            self.session.dataset.spectrum[0], self.session.dataset.beatfreq[0],
-            self.session.dataset.f
-        )
-        eff1, _ = aux.effective_beatfreq(
-            self.session.dataset.spectrum[1], self.session.dataset.beatfreq[1],
-            self.session.dataset.f
-        )
-        self.session.widgets.beatfreq[0] = eff0
-        self.session.widgets.beatfreq[1] = eff1
-        self.session.widgets.send_activate_reset_pll_dsp()
+        # dataset.beatfreq already holds the effective values: process_tick and
+        # the connect handshake overwrite it after effective_beatfreq_batch.
+        widgets = self.session.widgets
+        np.copyto(widgets.beatfreq, self.session.dataset.beatfreq)
+        widgets.send_activate_reset_pll_dsp()
 
     def _on_reacquire_release(self) -> None:
         """Send reset release, set Initial Freq to peak again, then clear plots (matches old client)."""
@@ -496,23 +596,51 @@ class MainLayout():
 
     def apply_server_variant(self) -> None:
         """Apply visibility and labels based on current server variant."""
-        # Default to reduced phasemeter UI when disconnected; only show full controls
-        # when a connected server explicitly advertises laser_lock.
-        server_variant = (
-            self.session.connection.server_variant
-            if self.session.connection is not None
-            else rp_protocol.RP_CAP_PHASEMETER
-        )
-        if server_variant == rp_protocol.RP_CAP_PHASEMETER:
-            self.ctrl_controls_widget.setVisible(False)
-            self.session.gui.pltCTRL.setVisible(False)
-            self.plots_grid.setRowStretch(4, 0)  # Ctrl row gets no space; others fill vertically
-            self.session.gui.set_freq_plot_for_phasemeter(True)
-        else:
-            self.ctrl_controls_widget.setVisible(True)
-            self.session.gui.pltCTRL.setVisible(True)
-            self.plots_grid.setRowStretch(4, 1)
-            self.session.gui.set_freq_plot_for_phasemeter(False)
+        with self._updates_suspended():
+            self.session.refresh_server_variant()
+            # Default to reduced phasemeter UI when disconnected; only show full controls
+            # when a connected server explicitly advertises laser_lock.
+            server_variant = (
+                self.session.connection.server_variant
+                if self.session.connection is not None
+                else rp_protocol.RP_CAP_PHASEMETER
+            )
+            if server_variant == rp_protocol.RP_CAP_PHASEMETER:
+                self.ctrl_controls_widget.setVisible(False)
+                self.session.gui.pltCTRL.setVisible(False)
+                self.plots_grid.setRowStretch(4, 0)  # Ctrl row gets no space; others fill vertically
+                self.session.gui.set_freq_plot_for_phasemeter(True)
+            else:
+                self._ensure_laser_lock_built()
+                self.ctrl_controls_widget.setVisible(True)
+                self.session.gui.pltCTRL.setVisible(True)
+                self.plots_grid.setRowStretch(4, 1)
+                self.session.gui.set_freq_plot_for_phasemeter(False)
+
+    @contextlib.contextmanager
+    def _updates_suspended(self):
+        """
+        Suspend repaints of the control and plot panes for a batch of changes.
+
+        Visibility and stretch changes made inside are laid out and painted
+        once when updates are re-enabled. Nested use is a no-op.
+        """
+        widgets = [w for w in (self.controls_widget, self.plots_widget) if w.updatesEnabled()]
+        for w in widgets:
+            w.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for w in widgets:
+                w.setUpdatesEnabled(True)
+
+    def _ensure_laser_lock_built(self) -> None:
+        """Build the laser-lock controls once; phasemeter-only sessions never need them."""
+        if self.ctrl_setting is None:
+            # Populate the panel with repaints off so it is laid out and painted once.
+            with self._updates_suspended():
+                self.ctrl_setting = LaserLockSettingLayout(self.session.widgets)
+                self.ctrl_controls_widget.setLayout(self.ctrl_setting)
 
     def is_phasemeter_mode(self) -> bool:
         """Return True when in phasemeter mode (default when disconnected)."""
@@ -559,6 +687,7 @@ class MainLayout():
                 row, self._plot_row_stretch_default.get(row, 1) if visible else 0
             )
         self._plot_visibility[key] = bool(visible)
+        self.session.any_plot_visible = any(self._plot_visibility.values())
 
     def is_plot_visible(self, key: str) -> bool:
         """Return whether the plot panel is currently visible."""
@@ -567,20 +696,21 @@ class MainLayout():
 
     def reset_layout(self) -> None:
         """Restore default splitter sizes and visible panels."""
-        if self._default_plot_visibility:
-            for key, visible in self._default_plot_visibility.items():
-                self.set_plot_visible(key, visible)
-        if self._default_splitter_sizes:
-            self.main_splitter.setSizes(self._default_splitter_sizes)
-        if self._default_controls_visible is not None:
-            self.set_controls_visible(self._default_controls_visible)
-        else:
-            self.set_controls_visible(True)
-        if self._default_warnings_visible is not None:
-            self.set_warnings_visible(self._default_warnings_visible)
-        else:
-            self.set_warnings_visible(True)
-        self.apply_server_variant()
+        with self._updates_suspended():
+            if self._default_plot_visibility:
+                for key, visible in self._default_plot_visibility.items():
+                    self.set_plot_visible(key, visible)
+            if self._default_splitter_sizes:
+                self.main_splitter.setSizes(self._default_splitter_sizes)
+            if self._default_controls_visible is not None:
+                self.set_controls_visible(self._default_controls_visible)
+            else:
+                self.set_controls_visible(True)
+            if self._default_warnings_visible is not None:
+                self.set_warnings_visible(self._default_warnings_visible)
+            else:
+                self.set_warnings_visible(True)
+            self.apply_server_variant()
 
     def set_render_paused(self, paused: bool) -> None:
         """Pause/unpause plot rendering without stopping acquisition."""
@@ -638,6 +768,10 @@ class MainLayout():
         """
         return self.session.fps
 
+    def set_fps_needed(self, needed: bool) -> None:
+        """Enable or skip fps tracking in the session (see Session.set_fps_needed)."""
+        self.session.set_fps_needed(needed)
+
     @property
     def parse_error_count(self):
         """
@@ -663,11 +797,10 @@ class ReadoutSettingLayout(QtWidgets.QGridLayout):
 		"""
 		super().__init__()
 
-		group_box_font = _make_group_box_font()
+		_install_group_box_font()
 
 		# --- PLL1 -------------------------------------
 		PLL1 = QtWidgets.QGroupBox("Channel 1 Phasemeter")
-		PLL1.setFont(group_box_font)
 		pll1_layout = QtWidgets.QVBoxLayout()
 		pll1_layout.addWidget(widgetls.ifreq_0.label)
 		pll1_layout.addWidget(widgetls.ifreq_0.box)  
@@ -679,7 +812,6 @@ class ReadoutSettingLayout(QtWidgets.QGridLayout):
 		PLL1.setLayout(pll1_layout)
 		# --- PLL2 -------------------------------------
 		PLL2 = QtWidgets.QGroupBox("Channel 2 Phasemeter")
-		PLL2.setFont(group_box_font)
 		pll2_layout = QtWidgets.QVBoxLayout()
 		pll2_layout.addWidget(widgetls.ifreq_1.label)
 		pll2_layout.addWidget(widgetls.ifreq_1.box)  
@@ -698,6 +830,23 @@ class ReadoutSettingLayout(QtWidgets.QGridLayout):
 
 
 class LaserLockSettingLayout(QtWidgets.QGridLayout):
+	# WidgetList name stems per group; the channel suffix (_0 / _1) is appended.
+	_PZT_WIDGETS = (
+		"piezo_switch_loop", "piezo_sign_loop", "piezo_offset", "piezo_gain_I", "piezo_gain_II",
+	)
+	_TEMP_WIDGETS = (
+		"temp_switch_loop", "temp_sign_loop", "temp_offset", "temp_gain_P", "temp_gain_I",
+	)
+	# (stem, part, row, col) in each channel's Reference grid.
+	_REFERENCE_PLACEMENTS = (
+		("freq_ref_loop", "label", 0, 0),
+		("freq_ref_loop", "box", 1, 0),
+		("freq_noise_floor", "label", 2, 0),
+		("freq_noise_floor", "box", 3, 0),
+		("freq_noise_corner", "label", 2, 1),
+		("freq_noise_corner", "box", 3, 1),
+	)
+
 	def __init__(self, widgetls):
 		"""
 		Build laser-lock controls (PZT/TEMP servos, reference freq) for two channels.
@@ -709,106 +858,89 @@ class LaserLockSettingLayout(QtWidgets.QGridLayout):
 		"""
 		super().__init__()
 
-		group_box_font = _make_group_box_font()
-
-		# --- PLL1 -------------------------------------
-		# *** PZT ********************************
-		PLL1_PZT = QtWidgets.QGroupBox("Channel 1 PZT Servo")
-		PLL1_PZT.setFont(group_box_font)
-		pll1_pzt = QtWidgets.QVBoxLayout()
-		pll1_pzt.addWidget(widgetls.piezo_switch_loop_0.label)
-		pll1_pzt.addWidget(widgetls.piezo_switch_loop_0.box)
-		pll1_pzt.addWidget(widgetls.piezo_sign_loop_0.label)
-		pll1_pzt.addWidget(widgetls.piezo_sign_loop_0.box)
-		pll1_pzt.addWidget(widgetls.piezo_offset_0.label)
-		pll1_pzt.addWidget(widgetls.piezo_offset_0.box)
-		pll1_pzt.addWidget(widgetls.piezo_gain_I_0.label)
-		pll1_pzt.addWidget(widgetls.piezo_gain_I_0.box)
-		pll1_pzt.addWidget(widgetls.piezo_gain_II_0.label)
-		pll1_pzt.addWidget(widgetls.piezo_gain_II_0.box)
-		PLL1_PZT.setLayout(pll1_pzt)
-		# *** Temps ********************************
-		PLL1_TEMP = QtWidgets.QGroupBox("Channel 1 TEMP Servo")
-		PLL1_TEMP.setFont(group_box_font)
-		pll1_temp = QtWidgets.QVBoxLayout()
-		pll1_temp.addWidget(widgetls.temp_switch_loop_0.label)
-		pll1_temp.addWidget(widgetls.temp_switch_loop_0.box)
-		pll1_temp.addWidget(widgetls.temp_sign_loop_0.label)
-		pll1_temp.addWidget(widgetls.temp_sign_loop_0.box)
-		pll1_temp.addWidget(widgetls.temp_offset_0.label)
-		pll1_temp.addWidget(widgetls.temp_offset_0.box)
-		pll1_temp.addWidget(widgetls.temp_gain_P_0.label)
-		pll1_temp.addWidget(widgetls.temp_gain_P_0.box)
-		pll1_temp.addWidget(widgetls.temp_gain_I_0.label)
-		pll1_temp.addWidget(widgetls.temp_gain_I_0.box)
-		PLL1_TEMP.setLayout(pll1_temp)
-		# *** Freq ********************************
-		PLL1_FREQ = QtWidgets.QGroupBox("Channel 1 Reference")
-		PLL1_FREQ.setFont(group_box_font)
-		pll1_freq = QtWidgets.QGridLayout()
-		pll1_freq.addWidget(widgetls.freq_ref_loop_0.label, 0,0)
-		pll1_freq.addWidget(widgetls.freq_ref_loop_0.box, 1,0)
-		pll1_freq.addWidget(widgetls.freq_noise_floor_0.label, 2,0)
-		pll1_freq.addWidget(widgetls.freq_noise_floor_0.box, 3,0)
-		pll1_freq.addWidget(widgetls.freq_noise_corner_0.label, 2,1)
-		pll1_freq.addWidget(widgetls.freq_noise_corner_0.box, 3,1)
-		PLL1_FREQ.setLayout(pll1_freq)
+		_install_group_box_font()
 
-		# --- PLL2 -------------------------------------
-		# *** PZT ********************************
-		PLL2_PZT = QtWidgets.QGroupBox("Channel 2 PZT Servo")
-		PLL2_PZT.setFont(group_box_font)
-		pll2_pzt = QtWidgets.QVBoxLayout()
-		pll2_pzt.addWidget(widgetls.piezo_switch_loop_1.label)
-		pll2_pzt.addWidget(widgetls.piezo_switch_loop_1.box)
-		pll2_pzt.addWidget(widgetls.piezo_sign_loop_1.label)
-		pll2_pzt.addWidget(widgetls.piezo_sign_loop_1.box)
-		pll2_pzt.addWidget(widgetls.piezo_offset_1.label)
-		pll2_pzt.addWidget(widgetls.piezo_offset_1.box)
-		pll2_pzt.addWidget(widgetls.piezo_gain_I_1.label)
-		pll2_pzt.addWidget(widgetls.piezo_gain_I_1.box)
-		pll2_pzt.addWidget(widgetls.piezo_gain_II_1.label)
-		pll2_pzt.addWidget(widgetls.piezo_gain_II_1.box)
-		PLL2_PZT.setLayout(pll2_pzt)
-		# *** Temps ********************************
-		PLL2_TEMP = QtWidgets.QGroupBox("Channel 2 TEMP Servo")
-		PLL2_TEMP.setFont(group_box_font)
-		pll2_temp = QtWidgets.QVBoxLayout()
-		pll2_temp.addWidget(widgetls.temp_switch_loop_1.label)
-		pll2_temp.addWidget(widgetls.temp_switch_loop_1.box)
-		pll2_temp.addWidget(widgetls.temp_sign_loop_1.label)
-		pll2_temp.addWidget(widgetls.temp_sign_loop_1.box)
-		pll2_temp.addWidget(widgetls.temp_offset_1.label)
-		pll2_temp.addWidget(widgetls.temp_offset_1.box)
-		pll2_temp.addWidget(widgetls.temp_gain_P_1.label)
-		pll2_temp.addWidget(widgetls.temp_gain_P_1.box)
-		pll2_temp.addWidget(widgetls.temp_gain_I_1.label)
-		pll2_temp.addWidget(widgetls.temp_gain_I_1.box)
-		PLL2_TEMP.setLayout(pll2_temp)
-		# *** Freq ********************************
-		PLL2_FREQ = QtWidgets.QGroupBox("Channel 2 Reference")
-		PLL2_FREQ.setFont(group_box_font)
-		pll2_freq = QtWidgets.QGridLayout()
-		pll2_freq.addWidget(widgetls.freq_ref_loop_1.label, 0,0)
-		pll2_freq.addWidget(widgetls.freq_ref_loop_1.box, 1,0)
-		pll2_freq.addWidget(widgetls.freq_noise_floor_1.label, 2,0)
-		pll2_freq.addWidget(widgetls.freq_noise_floor_1.box, 3,0)
-		pll2_freq.addWidget(widgetls.freq_noise_corner_1.label, 2,1)
-		pll2_freq.addWidget(widgetls.freq_noise_corner_1.box, 3,1)
-		PLL2_FREQ.setLayout(pll2_freq)
+		make_servo = self._make_servo_group
+		make_reference = self._make_reference_group
+		PLL1_PZT = make_servo(widgetls, "Channel 1 PZT Servo", self._PZT_WIDGETS, 0)
+		PLL1_TEMP = make_servo(widgetls, "Channel 1 TEMP Servo", self._TEMP_WIDGETS, 0)
+		PLL1_FREQ = make_reference(widgetls, "Channel 1 Reference", 0)
+		PLL2_PZT = make_servo(widgetls, "Channel 2 PZT Servo", self._PZT_WIDGETS, 1)
+		PLL2_TEMP = make_servo(widgetls, "Channel 2 TEMP Servo", self._TEMP_WIDGETS, 1)
+		PLL2_FREQ = make_reference(widgetls, "Channel 2 Reference", 1)
 
 		# --- add to layout -------------------------------------
-		self.addWidget(PLL1_PZT, 0, 0)
-		self.addWidget(PLL1_TEMP, 0, 1)
-		self.addWidget(PLL2_PZT, 0, 2)
-		self.addWidget(PLL2_TEMP, 0, 3)
-		self.addWidget(PLL1_FREQ, 1, 0, 1, 2)
-		self.addWidget(PLL2_FREQ, 1, 2, 1, 2)
-		self.addWidget(widgetls.pushButton_open_pll_0, 2, 0, 1, 2)
-		self.addWidget(widgetls.pushButton_open_pll_1, 2, 2, 1, 2)
-		self.setColumnStretch(0, 1)
-		self.setColumnStretch(1, 1)
-		self.setColumnStretch(2, 1)
-		self.setColumnStretch(3, 1)
+		add = self.addWidget
+		for w, row, col, row_span, col_span in (
+			(PLL1_PZT, 0, 0, 1, 1),
+			(PLL1_TEMP, 0, 1, 1, 1),
+			(PLL2_PZT, 0, 2, 1, 1),
+			(PLL2_TEMP, 0, 3, 1, 1),
+			(PLL1_FREQ, 1, 0, 1, 2),
+			(PLL2_FREQ, 1, 2, 1, 2),
+			(widgetls.pushButton_open_pll_0, 2, 0, 1, 2),
+			(widgetls.pushButton_open_pll_1, 2, 2, 1, 2),
+		):
+			add(w, row, col, row_span, col_span)
+		# Equal-width columns. The grid has no parent yet, so this only marks it dirty.
+		set_stretch = self.setColumnStretch
+		for col in range(4):
+			set_stretch(col, 1)
+
+	@staticmethod
+	def _make_servo_group(widgetls, title, stems, ch):
+		"""
+		Build a servo group box with one label-above-field row per widget.
+
+		Parameters
+		----------
+		widgetls : WidgetList
+			Widget list holding the servo controls.
+		title : str
+			Group box title.
+		stems : tuple of str
+			WidgetList attribute stems, in display order.
+		ch : int
+			Channel index (0 or 1), appended as the attribute suffix.
+
+		Returns
+		-------
+		QGroupBox
+			The populated group box.
+		"""
+		group = QtWidgets.QGroupBox(title)
+		form = QtWidgets.QFormLayout(group)
+		form.setRowWrapPolicy(QtWidgets.QFormLayout.WrapAllRows)
+		add_row = form.addRow
+		for stem in stems:
+			w = getattr(widgetls, f"{stem}_{ch}")
+			add_row(w.label, w.box)
+		return group
+
+	@classmethod
+	def _make_reference_group(cls, widgetls, title, ch):
+		"""
+		Build a channel's reference group (reference frequency, noise floor, corner).
+
+		Parameters
+		----------
+		widgetls : WidgetList
+			Widget list holding the reference controls.
+		title : str
+			Group box title.
+		ch : int
+			Channel index (0 or 1), appended as the attribute suffix.
+
+		Returns
+		-------
+		QGroupBox
+			The populated group box.
+		"""
+		group = QtWidgets.QGroupBox(title)
+		grid = QtWidgets.QGridLayout(group)
+		add = grid.addWidget
+		for stem, part, row, col in cls._REFERENCE_PLACEMENTS:
+			add(getattr(getattr(widgetls, f"{stem}_{ch}"), part), row, col)
+		return group
 
 
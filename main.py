@@ -42,6 +42,15 @@ import ipaddress
 import re
 from pathlib import Path
 from typing import Iterable, Optional
+
+# Prefer PyQt5 when it is installed: Qt6 bindings pay noticeably more per call,
+# which the widget-heavy control panels feel at startup. An explicit
+# PYQTGRAPH_QT_LIB still wins; otherwise pyqtgraph picks the default binding.
+if "PYQTGRAPH_QT_LIB" not in os.environ:
+    import importlib.util
+    if importlib.util.find_spec("PyQt5") is not None:
+        os.environ["PYQTGRAPH_QT_LIB"] = "PyQt5"
+
 from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 
 import acquire as acq
@@ -173,6 +182,18 @@ class MainWidget(QtWidgets.QWidget):
 
         self._refresh_connection_ui()
 
+    def showEvent(self, event) -> None:
+        """Resume fps tracking while the top bar (FPS label) is on screen."""
+        if self._layout is not None:
+            self._layout.set_fps_needed(True)
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        """Skip fps tracking while hidden or minimized; nothing displays it."""
+        if self._layout is not None:
+            self._layout.set_fps_needed(False)
+        super().hideEvent(event)
+
     def _window_title_base(self) -> str:
         """
         Return the window title base based on server mode.
@@ -315,22 +336,16 @@ class MainWidget(QtWidgets.QWidget):
                 )
                 if data0 is not None:
                     break
-            if data0 is not None:
-                self._layout.dataset.substitute_data(data0)
             if data0 is not None:
                 session = self._layout.session
-                session.dataset.update_t()
-                eff0, _ = aux.effective_beatfreq(
-                    session.dataset.spectrum[0], session.dataset.beatfreq[0],
-                    session.dataset.f
-                )
-                eff1, _ = aux.effective_beatfreq(
-                    session.dataset.spectrum[1], session.dataset.beatfreq[1],
+                session.dataset.ingest(data0)
+                (eff0, eff1), _ = aux.effective_beatfreq_batch(
+                    session.dataset.spectrum, session.dataset.beatfreq,
                     session.dataset.f
                 )
                 session.dataset.beatfreq[0] = eff0
                 session.dataset.beatfreq[1] = eff1
-                session.widgets.beatfreq = session.dataset.beatfreq.copy()
+                session.widgets.beatfreq[:] = session.dataset.beatfreq
                 cap_line = connection.capability_line
                 inferred_phasemeter = aux.infer_phasemeter_from_snapshot(session.dataset)
                 if cap_line is None:
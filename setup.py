@@ -25,6 +25,13 @@ setup(
     extras_require={
         # Dev dependencies: run tests with pip install -e ".[dev]" then pytest tests
         "dev": ["pytest"],
+        # Optional JIT for the per-frame corruption scan (falls back to NumPy).
+        "fast": ["numba"],
+        # Optional OpenGL viewport for the plots; experimental, enabled with
+        # USE_OPENGL = True in global_params (QPainter otherwise).
+        "opengl": ["PyOpenGL"],
+        # Optional Qt5 binding, preferred by main.py over PySide6 when present.
+        "qt5": ["PyQt5"],
     },
     entry_points={
         "console_scripts": [
@@ -29,8 +29,12 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
-"""Tests for acquire.check_frame_corruption and RPConnection (no socket)."""
+"""Tests for acquire.check_frame_corruption and RPConnection (local socketpair only)."""
+import socket
+
+import numpy as np
 import pytest
+import acquire
 import frame_schema
 from acquire import check_frame_corruption, RPConnection
 
@@ -68,7 +72,7 @@ def test_check_frame_corruption_many_negative_bins():
         out[frame_schema.FFT_RESULT_CHAN1_START + i] = -0.1
     corrupted, neg_bins, fft_max = check_frame_corruption(out)
     assert corrupted is True
-    assert neg_bins == 15
+    assert neg_bins > 10  # scan may stop at the 11th negative bin
 
 
 def test_check_frame_corruption_huge_fft_magnitude():
@@ -90,6 +94,27 @@ def test_check_frame_corruption_few_negative_bins_ok():
     assert neg_bins == 10
 
 
+def test_check_frame_corruption_negative_zero_not_counted():
+    """-0.0 bins set the sign bit but are not negative magnitudes."""
+    out = _make_frame(fft_ch1=[-0.0] * frame_schema.FFT_SIZE)
+    out[frame_schema.FFT_RESULT_CHAN1_START + 3] = 0.25
+    for frame in (out, np.asarray(out, dtype="<f8").tobytes()):
+        corrupted, neg_bins, fft_max = check_frame_corruption(frame)
+        assert corrupted is False
+        assert neg_bins == 0
+        assert fft_max == 0.25
+
+
+def test_check_frame_corruption_byte_offset():
+    """A frame at a byte offset into a larger buffer is scanned in place."""
+    out = _make_frame(fft_ch1=[0.5] * frame_schema.FFT_SIZE)
+    buf = bytearray(3) + np.asarray(out, dtype="<f8").tobytes()
+    corrupted, neg_bins, fft_max = check_frame_corruption(buf, 3)
+    assert corrupted is False
+    assert neg_bins == 0
+    assert fft_max == 0.5
+
+
 def test_check_frame_corruption_fft_max_just_under_threshold():
     """fft_max just under 1e6 is accepted."""
     out = _make_frame(fft_ch1=[0.0] * frame_schema.FFT_SIZE)
@@ -99,6 +124,59 @@ def test_check_frame_corruption_fft_max_just_under_threshold():
     assert fft_max == 5e5
 
 
+# Both FFT scan kernels: the compiled one (when numba is installed) and the
+# NumPy fallback used by the default install.
+_SCAN_KERNELS = pytest.mark.parametrize(
+    "scan_fft",
+    [acquire._scan_fft, acquire._scan_fft_numpy],
+    ids=["default", "numpy"],
+)
+
+
+def _nan_spike_frame():
+    """Frame with small FFT bins plus one >1e6 bin and one NaN bin (corrupted)."""
+    frame = np.asarray(
+        _make_frame(fft_ch1=[0.5] * frame_schema.FFT_SIZE), dtype="<f8"
+    )
+    frame[frame_schema.FFT_RESULT_CHAN1_START + 3] = 2e6
+    frame[frame_schema.FFT_RESULT_CHAN1_START + 7] = np.nan
+    return frame
+
+
+@_SCAN_KERNELS
+def test_check_frame_corruption_nan_bin_does_not_hide_huge_bin(monkeypatch, scan_fft):
+    """A NaN bin must not mask the fft_max > 1e6 rule (array and bytes input)."""
+    monkeypatch.setattr(acquire, "_scan_fft", scan_fft)
+    frame = _nan_spike_frame()
+    for output in (frame, frame.tobytes()):
+        corrupted, neg_bins, fft_max = check_frame_corruption(output)
+        assert corrupted is True
+        assert neg_bins == 0
+        assert fft_max == 2e6
+
+
+@_SCAN_KERNELS
+def test_rpconnection_read_frames_stops_before_nan_spike_frame(monkeypatch, scan_fft):
+    """The batched check rejects follow-up frames with a NaN and a >1e6 bin."""
+    monkeypatch.setattr(acquire, "_scan_fft", scan_fft)
+    clean = np.asarray(
+        _make_frame(fft_ch1=[0.5] * frame_schema.FFT_SIZE), dtype="<f8"
+    )
+    clean[frame_schema.FRAME_COUNTER] = 1.0
+    bad = _nan_spike_frame()
+    rx, tx = socket.socketpair()
+    try:
+        conn = RPConnection()
+        conn._socket = rx
+        tx.sendall(clean.tobytes() + bad.tobytes() + bad.tobytes())
+        out = conn.read_frames(max_n=3, timeout_s=1.0)
+        assert out.shape == (1, frame_schema.FRAME_SIZE_DOUBLES)
+        assert out[0, frame_schema.FRAME_COUNTER] == 1.0
+    finally:
+        rx.close()
+        tx.close()
+
+
 def test_rpconnection_read_frame_no_socket():
     """read_frame returns None when not connected."""
     conn = RPConnection()
@@ -106,6 +184,97 @@ def test_rpconnection_read_frame_no_socket():
     assert conn.last_read_status == "no_socket"
 
 
+def test_rpconnection_read_frame_returns_ndarray():
+    """read_frame returns an owned float64 ndarray for a complete frame."""
+    frame = np.asarray(
+        _make_frame(fft_ch1=[0.5] * frame_schema.FFT_SIZE), dtype="<f8"
+    )
+    frame[frame_schema.FRAME_COUNTER] = 7.0
+    rx, tx = socket.socketpair()
+    try:
+        conn = RPConnection()
+        conn._socket = rx
+        tx.sendall(frame.tobytes())
+        out = conn.read_frame(timeout_s=1.0)
+        assert conn.last_read_status == "ok"
+        assert isinstance(out, np.ndarray)
+        assert out.dtype == np.float64
+        assert out.flags.owndata
+        np.testing.assert_array_equal(out, frame)
+    finally:
+        rx.close()
+        tx.close()
+
+
+def test_rpconnection_read_frames_batches_buffered_frames():
+    """read_frames returns all buffered valid frames in one (n, N) array."""
+    frames = np.zeros((3, frame_schema.FRAME_SIZE_DOUBLES), dtype="<f8")
+    frames[:, frame_schema.FRAME_COUNTER] = [1.0, 2.0, 3.0]
+    rx, tx = socket.socketpair()
+    try:
+        conn = RPConnection()
+        conn._socket = rx
+        tx.sendall(frames.tobytes())
+        out = conn.read_frames(max_n=2)
+        assert out.shape == (2, frame_schema.FRAME_SIZE_DOUBLES)
+        np.testing.assert_array_equal(out[:, frame_schema.FRAME_COUNTER], [1.0, 2.0])
+        out = conn.read_frames()
+        assert out.shape == (1, frame_schema.FRAME_SIZE_DOUBLES)
+        assert out[0, frame_schema.FRAME_COUNTER] == 3.0
+        assert conn.last_read_status == "ok"
+    finally:
+        rx.close()
+        tx.close()
+
+
+def test_rpconnection_read_frame_view_is_zero_copy_until_released():
+    """read_frame_view returns a 'd' memoryview; the next read consumes it."""
+    frames = np.zeros((2, frame_schema.FRAME_SIZE_DOUBLES), dtype="<f8")
+    frames[:, frame_schema.FRAME_COUNTER] = [1.0, 2.0]
+    rx, tx = socket.socketpair()
+    try:
+        conn = RPConnection()
+        conn._socket = rx
+        tx.sendall(frames.tobytes())
+        view = conn.read_frame_view(timeout_s=1.0)
+        assert view.format == "d"
+        assert len(view) == frame_schema.FRAME_SIZE_DOUBLES
+        assert view[frame_schema.FRAME_COUNTER] == 1.0
+        conn.release_frame()
+        conn.release_frame()  # no-op once released
+        view = conn.read_frame_view(timeout_s=1.0)
+        assert view[frame_schema.FRAME_COUNTER] == 2.0
+        assert conn.read_frame() is None  # releases frame 2; nothing left
+        assert conn.last_read_status == "no_data"
+    finally:
+        rx.close()
+        tx.close()
+
+
+def test_rpconnection_reader_thread_queues_frames():
+    """With the background reader running, read_frame pops parsed frames."""
+    frames = np.zeros((2, frame_schema.FRAME_SIZE_DOUBLES), dtype="<f8")
+    frames[:, frame_schema.FRAME_COUNTER] = [1.0, 2.0]
+    rx, tx = socket.socketpair()
+    conn = RPConnection()
+    conn._socket = rx
+    try:
+        conn.start_reader_thread()
+        tx.sendall(frames.tobytes())
+        first = conn.read_frame(timeout_s=1.0)
+        assert first[frame_schema.FRAME_COUNTER] == 1.0
+        rest = conn.read_frames(timeout_s=1.0)
+        assert rest.shape == (1, frame_schema.FRAME_SIZE_DOUBLES)
+        assert rest[0, frame_schema.FRAME_COUNTER] == 2.0
+        tx.close()
+        assert conn.read_frame(timeout_s=1.0) is None
+        assert conn.last_read_status == "closed"
+    finally:
+        conn.disconnect()
+        tx.close()
+    assert conn._reader is None
+
+
 def test_rpconnection_set_log_callback():
     """set_log_callback stores callback for use when frame corruption is detected."""
     conn = RPConnection()
@@ -45,7 +45,10 @@ from data_models import (
     Frame,
     PlotViewModel,
     build_plot_view_model,
+    compute_freq_plot_t,
+    compute_health_snapshot,
     effective_beatfreq,
+    effective_beatfreq_batch,
 )
 
 
@@ -71,22 +74,79 @@ def test_parse_frame_returns_frame():
     assert frame.cnt == 42
     assert frame.pir[0] == 1.5e6
     assert frame.pir[1] == 2.0e6
-    assert len(frame.spectrum[0]) == frame_schema.FFT_SIZE
+    assert frame.spectrum.shape == (2, frame_schema.FFT_SIZE)
     assert frame.spectrum[0][0] == pytest.approx(0.1 * glp.ABS_CAL_FACTOR)
 
 
+def test_parse_frame_accepts_bytes():
+    raw = np.zeros(frame_schema.FRAME_SIZE_DOUBLES)
+    raw[frame_schema.FRAME_COUNTER] = 7.0
+    raw[frame_schema.PLL1Q] = -0.25
+    raw[frame_schema.MAX_ABS_FREQ1] = 3e6
+    raw[frame_schema.FFT_RESULT_CHAN2_START + 5] = 0.2
+    frame = DataPackage.parse_frame(raw.astype("<f8").tobytes())
+    assert frame.cnt == 7
+    assert frame.q[1] == -0.25
+    assert frame.beatfreq[1] == 3e6
+    assert frame.spectrum[1][5] == pytest.approx(0.2 * glp.ABS_CAL_FACTOR)
+    assert DataPackage.parse_frame(b"\x00" * 100) is None
+
+
+def test_parse_frame_fills_out_frame():
+    raw = np.zeros(frame_schema.FRAME_SIZE_DOUBLES)
+    raw[frame_schema.FRAME_COUNTER] = 11.0
+    raw[frame_schema.TEMP_ACT0] = -0.2
+    raw[frame_schema.FFT_RESULT_CHAN1_START + 1] = 0.3
+    scratch = Frame.empty()
+    frame = DataPackage.parse_frame(raw, out=scratch)
+    assert frame is scratch
+    assert frame.cnt == 11
+    assert frame.temp[0] == -0.2
+    assert frame.spectrum[0][1] == pytest.approx(0.3 * glp.ABS_CAL_FACTOR)
+    expected = DataPackage.parse_frame(raw)
+    assert np.array_equal(frame.spectrum, expected.spectrum)
+    assert DataPackage.parse_frame(raw[:5], out=scratch) is None
+    assert scratch.cnt == 11
+
+
+def test_parse_frame_does_not_alias_input():
+    raw = np.zeros(frame_schema.FRAME_SIZE_DOUBLES)
+    raw[frame_schema.PLL0PIR] = 1e6
+    frame = DataPackage.parse_frame(raw)
+    raw[frame_schema.PLL0PIR] = 2e6
+    assert frame.pir[0] == 1e6
+
+
 def test_build_plot_view_model():
     dataset = DataPackage()
-    dataset.f[0] = 1.0
     dataset.spectrum[0][0] = 2.0
     vm = build_plot_view_model(dataset)
     assert isinstance(vm, PlotViewModel)
     assert vm.f is dataset.f
-    assert vm.spectrum is dataset.spectrum
-    assert vm.beatfreq is dataset.beatfreq
-    assert vm.t is dataset.t
-    assert vm.i_t is dataset.i_t
-    assert vm.freq_plot_t is dataset.freqerr_t
+    np.testing.assert_array_equal(vm.spectrum, dataset.spectrum)
+    np.testing.assert_array_equal(vm.beatfreq, dataset.beatfreq)
+    np.testing.assert_array_equal(vm.t, dataset.t)
+    np.testing.assert_array_equal(vm.i_t, dataset.i_t)
+    np.testing.assert_array_equal(vm.freq_plot_t, dataset.freqerr_t)
+    assert not np.shares_memory(vm.spectrum, dataset.spectrum)
+    assert not np.shares_memory(vm.t, dataset.t)
+    assert not np.shares_memory(vm.i_t, dataset.i_t)
+
+
+def test_build_plot_view_model_survives_later_frames():
+    """Arrays handed to the plots are not rewritten by later frames."""
+    dp = DataPackage()
+    raw = np.zeros(frame_schema.FRAME_SIZE_DOUBLES)
+    raw[frame_schema.PLL0I] = 1.0
+    dp.ingest(raw)
+    vm = build_plot_view_model(dp)
+    t, i0 = vm.t.copy(), vm.i_t[0].copy()
+    raw[frame_schema.PLL0I] = 2.0
+    for _ in range(300):
+        dp.ingest(raw)
+    np.testing.assert_array_equal(vm.t, t)
+    np.testing.assert_array_equal(vm.i_t[0], i0)
+    assert np.all(np.diff(vm.t) > 0)
 
 
 def test_spectrum_frequency_axis_matches_fft_bins():
@@ -97,6 +157,8 @@ def test_spectrum_frequency_axis_matches_fft_bins():
     assert f[0] == 0.0
     assert f[1] == pytest.approx(125e6 / 1024)
     assert f[512] == pytest.approx(62.5e6)  # Nyquist
+    assert f is DataPackage().f  # shared constant
+    assert not f.flags.writeable
 
 
 def test_effective_beatfreq_server_zero_uses_argmax():
@@ -159,6 +221,20 @@ def test_effective_beatfreq_spectrum_below_threshold_returns_zero():
     assert used_fallback is True
 
 
+def test_effective_beatfreq_batch_matches_per_channel():
+    """Batched two-channel call agrees with effective_beatfreq on each channel."""
+    f = np.arange(513, dtype=float) * 125e6 / 1024
+    spec = np.zeros((2, 513))
+    spec[0, 100] = 0.1
+    spec[1, 300] = 1e-8  # below spec_thresh
+    for beatfreq in ([0.0, 0.0], [f[100], 20e6], [80e6, np.nan]):
+        beatfreq = np.array(beatfreq)
+        effs, fallbacks = effective_beatfreq_batch(spec, beatfreq, f)
+        for ch in range(2):
+            assert (effs[ch], fallbacks[ch]) == effective_beatfreq(spec[ch], beatfreq[ch], f)
+    assert effective_beatfreq_batch(np.zeros((2, 0)), np.zeros(2), f) == ((0.0, 0.0), (True, True))
+
+
 def test_datapackage_substitute_data_raw():
     """substitute_data accepts raw list and updates dataset."""
     dp = DataPackage()
@@ -172,6 +248,39 @@ def test_datapackage_substitute_data_raw():
     assert dp.beatfreq[0] == 10e6
 
 
+def test_datapackage_parse_into_writes_in_place():
+    """parse_into fills the existing snapshot arrays and rejects bad frames."""
+    dp = DataPackage()
+    spectrum, pir = dp.spectrum, dp.pir
+    raw = np.zeros(frame_schema.FRAME_SIZE_DOUBLES)
+    raw[frame_schema.FRAME_COUNTER] = 3.0
+    raw[frame_schema.FREQ_ERR1] = 0.5
+    raw[frame_schema.PLL0PIR] = 7e6
+    raw[frame_schema.FFT_RESULT_CHAN2_START] = 0.1
+    assert dp.parse_into(raw.tobytes()) is True
+    assert dp.spectrum is spectrum and dp.pir is pir
+    assert dp.cnt == 3
+    assert dp.freqerr[1] == 0.5
+    assert dp.pir[0] == 7e6
+    assert dp.spectrum[1][0] == pytest.approx(0.1 * glp.ABS_CAL_FACTOR)
+    assert dp.parse_into([0.0] * 10) is False
+    assert dp.cnt == 3
+
+
+def test_datapackage_substitute_frame_and_raw():
+    """Typed fast paths match the substitute_data dispatcher."""
+    raw = [0.0] * frame_schema.FRAME_SIZE_DOUBLES
+    raw[frame_schema.FRAME_COUNTER] = 5.0
+    raw[frame_schema.PIEZO_ACT1] = 0.3
+    by_frame = DataPackage()
+    by_frame.substitute_frame(DataPackage.parse_frame(raw))
+    by_raw = DataPackage()
+    assert by_raw.substitute_raw(raw) is True
+    for dp in (by_frame, by_raw):
+        assert dp.cnt == 5
+        assert dp.piezo[1] == 0.3
+
+
 def test_datapackage_clear():
     """clear resets all data to zeros/empty."""
     dp = DataPackage()
@@ -182,3 +291,115 @@ def test_datapackage_clear():
     assert dp.cnt == 0
     assert dp.spectrum[0][0] == 0.0
     assert dp.beatfreq[0] == 0.0
+
+
+def test_datapackage_update_t_rolls_window():
+    """update_t keeps a chronological window of TIME_PNTS samples."""
+    dp = DataPackage()
+    n = glp.TIME_PNTS
+    for k in range(n + 3):
+        dp.pir[:] = (k, -k)
+        dp.update_t()
+    assert len(dp.t) == n
+    assert dp.pir_t.shape == (2, n)
+    assert np.array_equal(dp.pir_t[0], np.arange(3, n + 3))
+    assert np.array_equal(dp.pir_t[1], -np.arange(3, n + 3))
+    assert np.all(np.diff(dp.t) == 1.0)
+    assert dp.t[-1] == 1.0 + n + 3
+
+
+def test_health_snapshot_fft_flags_corrupted_spectrum():
+    """FFT health is red for NaN or out-of-range spectrum bins."""
+    dp = DataPackage()
+    assert compute_health_snapshot(dp, True).fft == "green"
+    dp.spectrum[1][7] = np.nan
+    assert compute_health_snapshot(dp, True).fft == "red"
+    dp.spectrum[1][7] = 2e6
+    assert compute_health_snapshot(dp, True).fft == "red"
+
+
+def test_health_snapshot_levels():
+    """Worst channel wins for the scalar health rules."""
+    dp = DataPackage()
+    dp.i[:] = (0.5, 1e-4)
+    dp.q[:] = (0.0, 2.0)
+    dp.freqerr[:] = (1e-7, 1e-7)
+    dp.piezo[:] = (0.1, 0.7)
+    dp.temp[:] = (0.2, 0.0)
+    health = compute_health_snapshot(dp, False)
+    assert health.i_value == "yellow"
+    assert health.q_value == "red"
+    assert health.freq_error == "green"
+    assert health.ctrl == "yellow"
+    assert health.freq_readout == "green"
+    dp.spectrum[0][100] = 1.0
+    dp.spectrum[1][100] = 1.0
+    dp.pir[:] = (dp.f[100], -1.0)
+    assert compute_health_snapshot(dp, True).freq_readout == "red"
+    dp.pir[1] = dp.f[100] * 1.05
+    assert compute_health_snapshot(dp, True).freq_readout == "green"
+
+
+def test_health_snapshot_readout_still_checked_when_fft_red():
+    """A red FFT does not force the readout yellow: PIR is still compared with the argmax."""
+    dp = DataPackage()
+    dp.spectrum[0][100] = 2e6  # out of range: FFT red, but still the argmax bin
+    dp.spectrum[1][100] = 2e6
+    dp.pir[:] = (dp.f[100], dp.f[100])
+    health = compute_health_snapshot(dp, True)
+    assert health.fft == "red"
+    assert health.freq_readout == "green"
+    dp.pir[1] = dp.f[100] * 2
+    assert compute_health_snapshot(dp, True).freq_readout == "yellow"
+    dp.pir[1] = -1.0
+    assert compute_health_snapshot(dp, True).freq_readout == "red"
+
+
+def test_health_snapshot_fft_checks_foreign_axis():
+    """A non-shared f axis is still validated element-wise."""
+    dp = DataPackage()
+    dp.f = np.array(dp.f)
+    assert compute_health_snapshot(dp, False).fft == "green"
+    dp.f[10] += 1e3
+    assert compute_health_snapshot(dp, False).fft == "red"
+
+
+def test_compute_freq_plot_t_reference_offsets():
+    dp = DataPackage()
+    dp.pir[:] = (10e6, 20e6)
+    dp.update_t()
+    # Always a new array: the plots keep it while the ring moves on.
+    for out in (compute_freq_plot_t(dp, True), compute_freq_plot_t(dp, False, [0.0, 0.0])):
+        np.testing.assert_array_equal(out, dp.pir_t)
+        assert not np.shares_memory(out, dp.pir_t)
+    out = compute_freq_plot_t(dp, False, [9e6, 0.0])
+    assert out[0][-1] == 1e6
+    assert out[1][-1] == 20e6
+    # ndarray references (as Session passes them) work like a list.
+    np.testing.assert_array_equal(compute_freq_plot_t(dp, False, np.zeros(2)), dp.pir_t)
+    out = compute_freq_plot_t(dp, False, np.array([9e6, 1e6]))
+    assert out[0][-1] == 1e6 and out[1][-1] == 19e6
+    assert compute_freq_plot_t(dp, False, [9e6, 1e6]) is not out
+
+
+def test_datapackage_ingest_updates_snapshot_and_series():
+    dp = DataPackage()
+    raw = np.zeros(frame_schema.FRAME_SIZE_DOUBLES)
+    raw[frame_schema.PLL1I] = 0.4
+    assert dp.ingest(raw) is True
+    assert dp.i[1] == 0.4
+    assert dp.i_t[1][-1] == 0.4
+    t_last = dp.t[-1]
+    assert dp.ingest(raw[:10]) is False
+    assert dp.t[-1] == t_last
+
+
+def test_plot_view_model_carries_revisions():
+    dp = DataPackage()
+    vm0 = build_plot_view_model(dp)
+    dp.ingest(np.zeros(frame_schema.FRAME_SIZE_DOUBLES))
+    vm1 = build_plot_view_model(dp)
+    assert vm1.rev_spectrum == vm0.rev_spectrum + 1
+    assert vm1.rev_t == vm0.rev_t + 1
+    dp.clear()
+    assert build_plot_view_model(dp).rev_t != vm1.rev_t
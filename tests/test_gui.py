@@ -0,0 +1,101 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2026, Miguel Dovale (University of Arizona)
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+"""Tests for plot data ownership in gui.GuiLayout (offscreen Qt, no network)."""
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pytest
+
+pg = pytest.importorskip("pyqtgraph")
+
+import frame_schema
+import layout as ly
+
+
+class _FakeConnection:
+    """Connection stub whose read_frame serves frames with a rising I value."""
+
+    server_variant = "phasemeter"
+    last_read_status = "ok"
+    socket = None
+
+    def __init__(self):
+        self.count = 0
+
+    def read_frame(self, timeout_s=0.0):
+        self.count += 1
+        frame = np.zeros(frame_schema.FRAME_SIZE_DOUBLES)
+        frame[frame_schema.PLL0I] = float(self.count)
+        return frame
+
+    def is_connected(self):
+        return True
+
+    def set_log_callback(self, cb):
+        pass
+
+    def disconnect(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return pg.mkQApp()
+
+
+def test_paused_plot_keeps_drawn_data_across_view_changes(qapp):
+    """Frames ingested while paused must not change what a drawn curve shows."""
+    session = ly.Session()
+    session.connection = _FakeConnection()
+    session.process_tick()
+    qapp.processEvents()  # draws the pending view model
+    curve = session.gui.curveI1
+    drawn_x, drawn_y = np.array(curve.xData), np.array(curve.yData)
+    assert drawn_y[-1] > 0
+
+    session.render_paused = True
+    for _ in range(5):
+        session.process_tick()  # 5 ticks of up to max_frames_per_tick frames
+    qapp.processEvents()
+    assert session.frame_count > 300
+
+    session.gui.pltI.setXRange(drawn_x[200], drawn_x[800], padding=0)
+    qapp.processEvents()
+    np.testing.assert_array_equal(curve.xData, drawn_x)
+    np.testing.assert_array_equal(curve.yData, drawn_y)
+    x, y = curve.getData()
+    assert len(x) > 0
+    assert np.all(np.diff(x) >= 0)
+    assert np.isin(x, drawn_x).all()
+    assert np.isin(y, drawn_y).all()